@@ -1,18 +1,48 @@
+import atexit
+import functools
+import hashlib
 import os
+import queue
 import re
 import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 import pytesseract
 from PIL import Image
 import argparse
 
+try:
+    # tesserocr talks to the Tesseract C API directly, so the model is loaded once
+    # per process instead of once per pytesseract subprocess
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    # Aho-Corasick automaton finds every indicator/month keyword in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure Tesseract path for Windows
+@functools.cache
 def setup_tesseract_path():
-    """Configure pytesseract to find Tesseract on Windows"""
+    """Configure pytesseract to find Tesseract on Windows (probed once per process, on first OCR)"""
     try:
         import pytesseract
         
+        # Already pointed at a real executable (e.g. inherited by a forked worker)
+        cmd = pytesseract.pytesseract.tesseract_cmd
+        if cmd and os.path.exists(cmd):
+            return True
+        
         # Set your specific Tesseract path
         tesseract_path = "/path/to/tesseract.exe"  # ← EDIT THIS OR ensure tesseract is in PATH
         
@@ -52,43 +82,321 @@ def setup_tesseract_path():
         print("❌ pytesseract not installed")
         return False
 
-# Set up Tesseract when module is imported
-setup_tesseract_path()
+
+# Cheap check that a page's OCR text is usable: any month name or meeting keyword
+_MEETING_PAGE_RE = re.compile(
+    r'JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC|BOARD|MEETING', re.IGNORECASE
+)
+
+def _looks_like_meeting_page(text):
+    """Return True if OCR text contains any month name or meeting keyword"""
+    return _MEETING_PAGE_RE.search(text) is not None
+
+# Per-process tesserocr handle, created on first use so each worker loads it once
+_tess_api = None
+
+def _get_tess_api():
+    """Return this process's persistent tesserocr handle, or None if tesserocr is unavailable"""
+    global _tess_api
+    if _tess_api is None and PyTessBaseAPI is not None:
+        _tess_api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+        atexit.register(_tess_api.End)
+    return _tess_api
+
+def _ocr_image(image, psm):
+    """Run Tesseract on a PIL image with the given page segmentation mode"""
+    api = _get_tess_api()
+    if api is not None:
+        api.SetPageSegMode(PSM.SINGLE_BLOCK if psm == 6 else PSM.AUTO)
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    setup_tesseract_path()
+    return pytesseract.image_to_string(image, lang='eng', config=f'--psm {psm} --oem 1')
+
+# Full month names; any 3+ letter prefix of one (JAN, SEPT, ...) is accepted
+_MONTH_NAMES = ('JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
+                'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER')
+_MONTH_BY_PREFIX = {name[:3]: number for number, name in enumerate(_MONTH_NAMES, 1)}
+
+def month_number(token):
+    """Return the month number for an uppercase month name or abbreviation, else None"""
+    month = _MONTH_BY_PREFIX.get(token[:3])
+    if month is not None and len(token) >= 3 and _MONTH_NAMES[month - 1].startswith(token):
+        return month
+    return None
+
+def keyword_union(keywords):
+    """Compile one case-insensitive pattern that reports every keyword start in a single scan
+    
+    Longest alternatives come first so e.g. "OKLAHOMA CITY, OKLAHOMA" wins over
+    "OKLAHOMA CITY" at the same position; use with find_keywords().
+    """
+    return re.compile('(?=(' + '|'.join(
+        re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)
+    ) + '))', re.IGNORECASE)
+
+def find_keywords(pattern, keywords, text):
+    """Return the set of keywords (from a keyword_union pattern) present anywhere in text"""
+    hits = {hit.upper() for hit in pattern.findall(text)}
+    # A keyword nested inside a longer hit ("BOARD OF EDUCATION" inside
+    # "THE BOARD OF EDUCATION") is present too
+    return {kw for kw in keywords if any(kw in hit for hit in hits)}
+
+# Images per OCR task: large tiles amortise tesseract CLI start-up, while tesserocr
+# (model already loaded) only needs small ones to keep IPC overhead down
+OCR_TILE_SIZE = 16 if PyTessBaseAPI is None else 4
+
+# Bump when OCR settings change so text cached under older settings is ignored
+OCR_CACHE_VERSION = 3
+
+# Shorter side (px) that scans are reduced to before OCR - ample for Tesseract's
+# LSTM engine and far fewer pixels than a 300 DPI page
+OCR_TARGET_SIDE = 1600
+
+def _otsu_threshold(histogram):
+    """Return the Otsu threshold for a 256-bin grayscale histogram"""
+    total = sum(histogram)
+    sum_all = sum(i * count for i, count in enumerate(histogram))
+    sum_below = weight_below = 0
+    best_threshold, best_variance = 0, 0.0
+    
+    for threshold, count in enumerate(histogram):
+        weight_below += count
+        if weight_below == 0:
+            continue
+        weight_above = total - weight_below
+        if weight_above == 0:
+            break
+        
+        sum_below += threshold * count
+        mean_below = sum_below / weight_below
+        mean_above = (sum_all - sum_below) / weight_above
+        variance = weight_below * weight_above * (mean_below - mean_above) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = threshold, variance
+    
+    return best_threshold
+
+def preprocess_for_ocr(image):
+    """Convert to 8-bit grayscale, shrink to OCR_TARGET_SIDE and binarize (Otsu)"""
+    image = image.convert('L')
+    
+    shorter_side = min(image.size)
+    if shorter_side > OCR_TARGET_SIDE:
+        scale = OCR_TARGET_SIDE / shorter_side
+        new_size = (round(image.width * scale), round(image.height * scale))
+        image = image.resize(new_size, Image.BILINEAR)
+    
+    threshold = _otsu_threshold(image.histogram())
+    return image.point(lambda value: 255 if value > threshold else 0)
+
+def file_digest(path):
+    """Return a BLAKE2b digest of the file's bytes (the OCR cache key)"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def cache_digest(path):
+    """file_digest, or None for a file that can't be read - a cache miss, so OCR reports it"""
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+def count_entries(directory):
+    """Count the entries in a directory without building a list of them"""
+    with os.scandir(directory) as it:
+        return sum(1 for _ in it)
+
+def _copy_file_range(src, dst):
+    """Copy src to dst in the kernel (a reflink on filesystems that support it)"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+def place_file(src, dst, link=True):
+    """Place src at dst as a hardlink when possible, otherwise as a copy
+    
+    A hardlink makes the organized folder a view onto the source scans: no bytes
+    are duplicated, but both names refer to the same file on disk.
+    """
+    if os.path.exists(dst):
+        if link and os.path.samefile(src, dst):
+            return  # already linked by an earlier run
+        os.remove(dst)
+    
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # different drive, or a filesystem without hardlinks
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            _copy_file_range(src, dst)
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
+def _load_for_ocr(image_path):
+    """Open and preprocess an image for better (and faster) OCR"""
+    with Image.open(image_path) as image:
+        # JPEGs are decoded straight to grayscale at the smallest DCT scale that
+        # still covers OCR_TARGET_SIDE (no-op for other formats)
+        image.draft('L', (OCR_TARGET_SIDE, OCR_TARGET_SIDE))
+        return preprocess_for_ocr(image)
+
+def _retry_unrecognised(image, text):
+    """Re-OCR with automatic page segmentation if the single-block text looks unusable"""
+    # Uniform block of text fits the typed minutes; only fall back to fully
+    # automatic page segmentation when that comes back empty or unrecognisable
+    if _looks_like_meeting_page(text):
+        return text
+    try:
+        fallback = _ocr_image(image, psm=3)
+        if len(fallback.strip()) > len(text.strip()):
+            return fallback
+    except Exception:
+        pass
+    return text
+
+def extract_text(image_path):
+    """Extract text from image using OCR (module-level so worker processes can pickle it)"""
+    try:
+        image = _load_for_ocr(image_path)
+        return _retry_unrecognised(image, _ocr_image(image, psm=6))
+        
+    except Exception as e:
+        print(f"Error extracting text from {image_path}: {e}")
+        return ""
+
+def _batch_ocr(images):
+    """OCR several PIL images with a single tesseract CLI call
+    
+    Tesseract accepts a text file listing image paths and writes all pages to one
+    output separated by form feeds, so the model is loaded once per batch rather
+    than once per image.
+    """
+    setup_tesseract_path()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_list = Path(temp_dir) / "images.txt"
+        paths = []
+        for n, image in enumerate(images):
+            path = Path(temp_dir) / f"page_{n:03d}.png"
+            image.save(path)
+            paths.append(os.fspath(path))
+        image_list.write_text("\n".join(paths) + "\n", encoding='utf-8')
+        
+        result = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, os.fspath(image_list), 'stdout',
+             '-l', 'eng', '--psm', '6', '--oem', '1'],
+            capture_output=True, check=True
+        )
+    
+    pages = result.stdout.decode('utf-8', errors='replace').split('\f')
+    if len(pages) < len(images):
+        raise RuntimeError(f"expected {len(images)} pages from tesseract, got {len(pages)}")
+    return pages[:len(images)]
+
+def extract_texts(image_paths):
+    """Extract text from a tile of images, returned in the same order
+    
+    With tesserocr the model is already resident, so images are simply OCR'd in
+    turn; with the tesseract CLI the whole tile goes through one _batch_ocr call.
+    """
+    if _get_tess_api() is not None or len(image_paths) == 1:
+        return [extract_text(path) for path in image_paths]
+    
+    images = {}
+    for path in image_paths:
+        try:
+            images[path] = _load_for_ocr(path)
+        except Exception as e:
+            print(f"Error extracting text from {path}: {e}")
+    
+    try:
+        batch_texts = _batch_ocr(list(images.values()))
+    except Exception as e:
+        print(f"Batch OCR failed ({e}), falling back to one image at a time")
+        return [extract_text(path) for path in image_paths]
+    
+    texts = dict(zip(images, batch_texts))
+    return [_retry_unrecognised(images[path], texts[path]) if path in images else ""
+            for path in image_paths]
 
 class DebugMeetingMinutesOrganizer:
-    def __init__(self, source_folder, output_folder, debug_mode=True):
+    def __init__(self, source_folder, output_folder, debug_mode=True, workers=None, use_cache=True,
+                 use_links=True):
         self.source_folder = Path(source_folder)
         self.output_folder = Path(output_folder)
         self.current_meeting_folder = None
         self.current_meeting_date = None
         self.debug_mode = debug_mode
+        self.workers = workers or os.cpu_count() or 1
+        self.use_links = use_links
+        
+        # Folders already created this run, so per-page placement skips mkdir
+        self._known_dirs = set()
+        
+        # Files waiting for the placement thread to link/copy them
+        self._placement_queue = queue.Queue(maxsize=64)
+        self._cache_hits = 0
         
         # Create output folder if it doesn't exist
-        self.output_folder.mkdir(exist_ok=True)
+        self._ensure_dir(self.output_folder)
+        self.unassigned_folder = self.output_folder / "unassigned"
+        
+        # OCR results persisted across runs, keyed by image content
+        self.ocr_cache_path = self.output_folder / ".ocr_cache.sqlite" if use_cache else None
         
         # Create debug folder
         if debug_mode:
             self.debug_folder = self.output_folder / "debug_ocr_output"
-            self.debug_folder.mkdir(exist_ok=True)
-        
-        # Date patterns to match various formats in the documents
-        self.date_patterns = [
-            # "MEETING OF JANUARY 5, 1971"
-            r'MEETING\s+OF\s+([A-Z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            # "January 5, 1971"
-            r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            # "JANUARY 5, 1971"
-            r'([A-Z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            # Additional patterns for other possible formats
-            r'(\d{1,2})\s+([A-Z][a-z]+)\s+(\d{4})',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',
-            # More flexible patterns for 1971
-            r'MEETING.*?([A-Z]+)\s+(\d{1,2}),?\s+(19\d{2})',
-            r'BOARD.*?EDUCATION.*?([A-Z]+)\s+(\d{1,2}),?\s+(19\d{2})',
+            self._ensure_dir(self.debug_folder)
+        
+        # All supported date formats folded into one pattern (compiled once here,
+        # parse_date runs against every page). The lookahead lets finditer try every
+        # word start, so an unparseable candidate can't swallow a real date after it.
+        # OCR text keeps its original case, so matching is case-insensitive
+        self._date_re = re.compile(r'''(?=\b(?:
+            # "MEETING OF JANUARY 5, 1971", "January 5, 1971", "JAN 5 1971"
+            (?P<header>MEETING\s+OF\s+)?(?P<month>[A-Z]{3,})\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})
+            # "5 January 1971"
+            | (?P<day2>\d{1,2})\s+(?P<month2>[A-Z]{3,})\s+(?P<year2>\d{4})
+            # "1/5/1971" (assumed MM/DD/YYYY)
+            | (?P<nmonth>\d{1,2})/(?P<nday>\d{1,2})/(?P<nyear>\d{4})
+            # "1971-01-05"
+            | (?P<iyear>\d{4})-(?P<imonth>\d{1,2})-(?P<iday>\d{1,2})
+        )(?!\d))''', re.IGNORECASE | re.VERBOSE)
+        
+        # Meeting header indicators - more flexible for 1971
+        self.meeting_indicators = [
+            "MEETING OF",
+            "THE BOARD OF EDUCATION",
+            "OKLAHOMA CITY, OKLAHOMA", 
+            "MET IN REGULAR SESSION",
+            "MET IN ADJOURNED SESSION",
+            "BOARD OF EDUCATION",
+            "OKLAHOMA CITY",
+        ]
+        self._indicator_re = keyword_union(self.meeting_indicators)
+        
+        # Wider keyword list reported in the debug files
+        self.debug_indicators = self.meeting_indicators + [
+            "MEETING",
+            "JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
+            "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER"
         ]
+        self._debug_indicator_re = keyword_union(self.debug_indicators)
         
-        # Month name mapping
+        # Month names and abbreviations the keyword scanners look for
         self.month_names = {
             'JANUARY': 1, 'JAN': 1,
             'FEBRUARY': 2, 'FEB': 2,
@@ -103,39 +411,31 @@ class DebugMeetingMinutesOrganizer:
             'NOVEMBER': 11, 'NOV': 11,
             'DECEMBER': 12, 'DEC': 12
         }
+        
+        self._month_re = re.compile('|'.join(self.month_names), re.IGNORECASE)
+        # Every numeric date format has a digit, separator, digit run somewhere
+        self._numeric_date_hint_re = re.compile(r'\d[/-]\d')
+        
+        # Single-pass keyword scanner over indicators and month names
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for kw in self.meeting_indicators:
+                self._keyword_automaton.add_word(kw.lower(), (kw, False))
+            for month in self.month_names:
+                self._keyword_automaton.add_word(month.lower(), (month, True))
+            self._keyword_automaton.make_automaton()
+        else:
+            self._keyword_automaton = None
+
+    def _ensure_dir(self, folder):
+        """Create folder (and parents) the first time it is needed this run"""
+        if folder not in self._known_dirs:
+            folder.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(folder)
 
     def extract_text_from_image(self, image_path):
         """Extract text from image using OCR"""
-        try:
-            # Open and preprocess image for better OCR
-            image = Image.open(image_path)
-            
-            # Convert to grayscale for better OCR results
-            if image.mode not in ['L', 'RGB']:
-                image = image.convert('RGB')
-            
-            # Try different OCR configurations
-            configs = [
-                '--psm 6',  # Uniform block of text
-                '--psm 4',  # Single column of text
-                '--psm 3',  # Fully automatic page segmentation
-                '--psm 1',  # Automatic page segmentation with OSD
-            ]
-            
-            best_text = ""
-            for config in configs:
-                try:
-                    text = pytesseract.image_to_string(image, config=config)
-                    if len(text.strip()) > len(best_text.strip()):
-                        best_text = text
-                except:
-                    continue
-            
-            return best_text.upper()  # Convert to uppercase for consistent matching
-            
-        except Exception as e:
-            print(f"Error extracting text from {image_path}: {e}")
-            return ""
+        return extract_text(image_path)
 
     def save_debug_info(self, image_path, text, is_meeting_start, parsed_date):
         """Save debug information for troubleshooting"""
@@ -144,121 +444,125 @@ class DebugMeetingMinutesOrganizer:
             
         debug_file = self.debug_folder / f"{image_path.stem}_debug.txt"
         
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(f"Image: {image_path.name}\n")
-            f.write(f"Is Meeting Start: {is_meeting_start}\n")
-            f.write(f"Parsed Date: {parsed_date}\n")
-            f.write("=" * 50 + "\n")
-            f.write("OCR Text:\n")
-            f.write(text)
-            f.write("\n" + "=" * 50 + "\n")
-            
-            # Check for meeting indicators
-            meeting_indicators = [
-                "MEETING OF",
-                "THE BOARD OF EDUCATION", 
-                "OKLAHOMA CITY, OKLAHOMA",
-                "MET IN REGULAR SESSION",
-                "MET IN ADJOURNED SESSION",
-                "BOARD OF EDUCATION",
-                "OKLAHOMA CITY",
-                "MEETING",
-                "JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
-                "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER"
-            ]
+        # Build the whole record in memory and write it with a single call
+        parts = [
+            f"Image: {image_path.name}\n",
+            f"Is Meeting Start: {is_meeting_start}\n",
+            f"Parsed Date: {parsed_date}\n",
+            "=" * 50 + "\n",
+            "OCR Text:\n",
+            text,
+            "\n" + "=" * 50 + "\n",
+            "Found Indicators:\n",
+        ]
+        found = find_keywords(self._debug_indicator_re, self.debug_indicators, text)
+        for indicator in self.debug_indicators:
+            if indicator in found:
+                parts.append(f"✅ {indicator}\n")
+            else:
+                parts.append(f"❌ {indicator}\n")
+        
+        debug_file.write_text(''.join(parts), encoding='utf-8')
+
+    def parse_date(self, text, has_month=None):
+        """Extract the meeting date from text
+        
+        A "MEETING OF <date>" header wins; otherwise the first valid date on the
+        page is used. has_month says whether any month keyword is on the page (checked here when
+        the caller doesn't already know). Without one only the numeric formats can
+        succeed, and pages with no digit/separator run can't match those either.
+        """
+        if has_month is None:
+            has_month = self._month_re.search(text) is not None
+        if not has_month and not self._numeric_date_hint_re.search(text):
+            return None
+        
+        first_date = None
+        for match in self._date_re.finditer(text):
+            date = self._date_from_match(match)
+            if date is None:
+                continue
+            if match.group('header'):
+                first_date = date
+                break
+            if first_date is None:
+                first_date = date
+        
+        if first_date and self.debug_mode:
+            print(f"    📅 Date found: {first_date.strftime('%Y-%m-%d')}")
+        return first_date
+
+    def _date_from_match(self, match):
+        """Turn one _date_re match into a datetime, or None if it isn't a real date"""
+        groups = match.groupdict()
+        try:
+            if groups['month']:  # Month name first
+                month = month_number(groups['month'].upper())
+                day, year = int(groups['day']), int(groups['year'])
+            elif groups['month2']:  # Day, month name, year
+                month = month_number(groups['month2'].upper())
+                day, year = int(groups['day2']), int(groups['year2'])
+            elif groups['nmonth']:  # MM/DD/YYYY
+                month, day, year = int(groups['nmonth']), int(groups['nday']), int(groups['nyear'])
+            else:  # YYYY-MM-DD
+                month, day, year = int(groups['imonth']), int(groups['iday']), int(groups['iyear'])
             
-            f.write("Found Indicators:\n")
-            for indicator in meeting_indicators:
-                if indicator in text:
-                    f.write(f"✅ {indicator}\n")
-                else:
-                    f.write(f"❌ {indicator}\n")
-
-    def parse_date(self, text):
-        """Extract date from text using regex patterns"""
-        for i, pattern in enumerate(self.date_patterns):
-            matches = re.search(pattern, text)
-            if matches:
-                groups = matches.groups()
-                
-                try:
-                    # Handle different pattern formats
-                    if len(groups) == 3:
-                        if groups[0].isalpha():  # Month name first
-                            month_str = groups[0]
-                            day = int(groups[1])
-                            year = int(groups[2])
-                            
-                            # Convert month name to number
-                            month = self.month_names.get(month_str)
-                            if month is None:
-                                continue
-                                
-                        elif groups[1].isalpha():  # Day, month name, year
-                            day = int(groups[0])
-                            month_str = groups[1]
-                            year = int(groups[2])
-                            
-                            month = self.month_names.get(month_str)
-                            if month is None:
-                                continue
-                                
-                        else:  # Numeric format
-                            # Could be MM/DD/YYYY or DD/MM/YYYY - assume MM/DD/YYYY
-                            month = int(groups[0])
-                            day = int(groups[1])
-                            year = int(groups[2])
-                    
-                    # Validate date
-                    if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2100:
-                        if self.debug_mode:
-                            print(f"    📅 Date found with pattern {i}: {year}-{month:02d}-{day:02d}")
-                        return datetime(year, month, day)
-                        
-                except (ValueError, TypeError) as e:
-                    if self.debug_mode:
-                        print(f"    ❌ Date parse error with pattern {i}: {e}")
-                    continue
-                    
-        return None
+            if month is None or not 1900 <= year <= 2100:
+                return None
+            return datetime(year, month, day)
+        except ValueError:
+            return None  # e.g. February 30
 
     def get_folder_name(self, date_obj):
         """Generate folder name in YYYY-MM-DD format"""
         return date_obj.strftime("%Y-%m-%d")
 
+    def _find_indicators(self, text):
+        """Return the set of meeting indicators that occur anywhere in text"""
+        return find_keywords(self._indicator_re, self.meeting_indicators, text)
+
+    def _scan_keywords(self, text):
+        """Return (indicators found, whether any month name appears) for a page"""
+        if self._keyword_automaton is None:
+            return self._find_indicators(text), self._month_re.search(text) is not None
+        
+        indicators = set()
+        has_month = False
+        for _, (kw, is_month) in self._keyword_automaton.iter(text.lower()):
+            if is_month:
+                has_month = True
+            else:
+                indicators.add(kw)
+        return indicators, has_month
+
     def is_meeting_start_page(self, text):
-        """Determine if this page starts a new meeting"""
-        # Look for meeting header indicators - more flexible for 1971
-        meeting_indicators = [
-            "MEETING OF",
-            "THE BOARD OF EDUCATION",
-            "OKLAHOMA CITY, OKLAHOMA", 
-            "MET IN REGULAR SESSION",
-            "MET IN ADJOURNED SESSION",
-            "BOARD OF EDUCATION",
-            "OKLAHOMA CITY",
-        ]
+        """Determine if this page starts a new meeting
         
-        # Count how many indicators are present
-        indicator_count = sum(1 for indicator in meeting_indicators if indicator in text)
+        Returns (is_meeting_start, parsed_date) so callers don't parse the date twice;
+        parsed_date is None when the page isn't a meeting start or has no readable date.
+        """
+        # Count how many distinct indicators are present
+        indicators, has_month = self._scan_keywords(text)
+        indicator_count = len(indicators)
+        if indicator_count == 0:
+            return False, None
         
         # Also look for date patterns as additional evidence
-        has_date = self.parse_date(text) is not None
+        parsed_date = self.parse_date(text, has_month=has_month)
         
         # More lenient criteria for 1971 - either multiple indicators OR date + some indicators
-        is_meeting_start = indicator_count >= 2 or (has_date and indicator_count >= 1)
+        is_meeting_start = indicator_count >= 2 or parsed_date is not None
         
-        return is_meeting_start
+        return is_meeting_start, parsed_date
 
     def organize_files(self, max_files=None):
         """Main method to organize all meeting files"""
-        # Get all image files
+        # Get all image files in one directory pass (suffix compared case-insensitively,
+        # which also avoids listing files twice on case-insensitive filesystems)
         image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
-        image_files = []
-        
-        for ext in image_extensions:
-            image_files.extend(self.source_folder.glob(f'*{ext}'))
-            image_files.extend(self.source_folder.glob(f'*{ext.upper()}'))
+        with os.scandir(self.source_folder) as entries:
+            image_files = [Path(entry.path) for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions]
         
         # Sort files by name to maintain order
         image_files.sort()
@@ -269,33 +573,149 @@ class DebugMeetingMinutesOrganizer:
         
         print(f"Found {len(image_files)} image files to process")
         
+        cache = sqlite3.connect(self.ocr_cache_path) if self.ocr_cache_path else None
+        executor = None
+        placer = None
+        try:
+            # OCR runs in worker processes; results come back in submission order so
+            # the folder assignment below still sees the pages in sequence
+            if self.workers > 1 and len(image_files) > 1:
+                # One Tesseract thread per process - N single-threaded processes beat
+                # one process fighting N OpenMP threads
+                os.environ["OMP_THREAD_LIMIT"] = "1"
+                # Configure Tesseract before the workers fork so they inherit the path
+                if PyTessBaseAPI is None:
+                    setup_tesseract_path()
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+                # Workers fork on the first submit: do it now, before any thread starts, so
+                # no child inherits a lock (e.g. stdout's) held by the placer or reader thread
+                executor.submit(os.getpid).result()
+            
+            placer = threading.Thread(target=self._placement_worker, daemon=True)
+            placer.start()
+            texts = self._ocr_pipeline(image_files, cache, executor)
+            self._assign_files(image_files, texts)
+            if cache:
+                print(f"♻️ Reused cached OCR for {self._cache_hits} of {len(image_files)} files")
+        finally:
+            if placer:
+                self._placement_queue.put(None)
+                placer.join()
+            if executor:
+                executor.shutdown(cancel_futures=True)
+            if cache:
+                cache.close()
+    
+    def _ocr_pipeline(self, image_files, cache, executor):
+        """Yield OCR text for image_files in page order
+        
+        A reader thread hashes the images ahead of time; each one is looked up in the
+        cache as its hash arrives and misses are submitted for OCR straight away. A
+        bounded window of pages is kept in flight, so disk reads, OCR and the caller's
+        folder assignment overlap instead of running one after another.
+        """
+        self._cache_hits = 0
+        # Keep enough pages in flight for every worker to have a couple of tiles queued
+        window = max(8, 2 * OCR_TILE_SIZE * self.workers)
+        pending = deque()
+        tile = []
+        
+        if cache is not None:
+            cache.execute("CREATE TABLE IF NOT EXISTS ocr (hash TEXT PRIMARY KEY, text TEXT)")
+        
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            digests = reader.map(cache_digest, image_files) if cache is not None else repeat(None)
+            for path, digest in zip(image_files, digests):
+                key = None
+                if digest is not None:
+                    key = f"{OCR_CACHE_VERSION}:{digest}"
+                    row = cache.execute("SELECT text FROM ocr WHERE hash = ?", (key,)).fetchone()
+                    if row:
+                        self._cache_hits += 1
+                        pending.append([key, row[0], None])
+                        continue
+                
+                # Misses are grouped into tiles; each entry records its index in the tile
+                entry = [key, None, len(tile)]
+                tile.append((path, entry))
+                pending.append(entry)
+                if len(tile) >= OCR_TILE_SIZE:
+                    self._submit_tile(executor, tile)
+                    tile = []
+                
+                while len(pending) >= window:
+                    if pending[0][1] is None:
+                        self._submit_tile(executor, tile)
+                        tile = []
+                    yield self._finish_ocr(cache, *pending.popleft())
+            
+            if tile:
+                self._submit_tile(executor, tile)
+            while pending:
+                yield self._finish_ocr(cache, *pending.popleft())
+    
+    def _submit_tile(self, executor, tile):
+        """Start OCR for a tile of (path, entry) pairs, sharing one Future between them"""
+        paths = [path for path, _ in tile]
+        if executor:
+            future = executor.submit(extract_texts, paths)
+        else:
+            future = Future()
+            future.set_result(extract_texts(paths))
+        
+        for _, entry in tile:
+            entry[1] = future
+    
+    def _finish_ocr(self, cache, key, result, index):
+        """Resolve one pipeline entry (cached text or tile Future) to its text"""
+        if isinstance(result, str):
+            return result
+        
+        text = result.result()[index]
+        # Empty text usually means OCR failed - leave it uncached so it is retried
+        if cache is not None and text:
+            with cache:
+                cache.execute("INSERT OR REPLACE INTO ocr (hash, text) VALUES (?, ?)", (key, text))
+        return text
+    
+    def _place(self, src, dst):
+        """Queue src to be linked/copied to dst by the placement thread"""
+        self._placement_queue.put((src, dst))
+    
+    def _placement_worker(self):
+        """Link or copy queued files into place until a None sentinel arrives"""
+        while True:
+            item = self._placement_queue.get()
+            if item is None:
+                return
+            src, dst = item
+            try:
+                place_file(src, dst, link=self.use_links)
+            except Exception as e:
+                print(f"  ❌ Error placing {src.name} in {dst.parent.name}: {e}")
+    
+    def _assign_files(self, image_files, texts):
+        """Walk the OCR results in page order and copy each file into its meeting folder"""
         meeting_starts_found = 0
         
-        for i, file_path in enumerate(image_files):
+        for i, (file_path, text) in enumerate(zip(image_files, texts)):
             print(f"Processing {i+1}/{len(image_files)}: {file_path.name}")
             
             try:
-                # Extract text from image
-                text = self.extract_text_from_image(file_path)
-                
                 if self.debug_mode and i < 10:  # Show OCR results for first 10 files
                     print(f"  📝 OCR extracted {len(text)} characters")
                     if text:
                         print(f"  📖 First 200 chars: {text[:200]}...")
                 
-                # Check if this is a meeting start page
-                is_meeting_start = self.is_meeting_start_page(text)
-                parsed_date = None
+                # Check if this is a meeting start page (and pick up its date)
+                is_meeting_start, parsed_date = self.is_meeting_start_page(text)
                 
                 if is_meeting_start:
-                    # Try to extract date
-                    parsed_date = self.parse_date(text)
-                    
                     if parsed_date:
                         # Create new meeting folder
                         folder_name = self.get_folder_name(parsed_date)
                         self.current_meeting_folder = self.output_folder / folder_name
-                        self.current_meeting_folder.mkdir(exist_ok=True)
+                        self._ensure_dir(self.current_meeting_folder)
                         self.current_meeting_date = parsed_date
                         
                         print(f"  🎉 New meeting detected: {parsed_date.strftime('%B %d, %Y')}")
@@ -312,14 +732,13 @@ class DebugMeetingMinutesOrganizer:
                 # Copy file to current meeting folder
                 if self.current_meeting_folder:
                     destination = self.current_meeting_folder / file_path.name
-                    shutil.copy2(file_path, destination)
+                    self._place(file_path, destination)
                     print(f"  ✅ Copied to: {self.current_meeting_folder.name}")
                 else:
                     # Create "unassigned" folder for files without a meeting
-                    unassigned_folder = self.output_folder / "unassigned"
-                    unassigned_folder.mkdir(exist_ok=True)
-                    destination = unassigned_folder / file_path.name
-                    shutil.copy2(file_path, destination)
+                    self._ensure_dir(self.unassigned_folder)
+                    destination = self.unassigned_folder / file_path.name
+                    self._place(file_path, destination)
                     print(f"  📋 Copied to: unassigned (no meeting folder determined)")
                     
             except Exception as e:
@@ -336,21 +755,21 @@ class DebugMeetingMinutesOrganizer:
             f.write("Meeting Minutes Organization Report\n")
             f.write("=" * 40 + "\n\n")
             
-            # List all created folders
-            meeting_folders = [d for d in self.output_folder.iterdir() 
-                             if d.is_dir() and d.name not in ["unassigned", "debug_ocr_output"]]
-            meeting_folders.sort()
+            # List all created folders (scandir entries cache their type, so no extra stat per folder)
+            with os.scandir(self.output_folder) as it:
+                meeting_folders = [entry for entry in it 
+                                 if entry.is_dir() and entry.name not in ["unassigned", "debug_ocr_output"]]
+            meeting_folders.sort(key=lambda entry: entry.name)
             
             f.write(f"Total meetings organized: {len(meeting_folders)}\n\n")
             
             for folder in meeting_folders:
-                files_count = len(list(folder.iterdir()))
+                files_count = count_entries(folder.path)
                 f.write(f"{folder.name}: {files_count} files\n")
             
             # Check unassigned folder
-            unassigned_folder = self.output_folder / "unassigned"
-            if unassigned_folder.exists():
-                unassigned_count = len(list(unassigned_folder.iterdir()))
+            if self.unassigned_folder.exists():
+                unassigned_count = count_entries(self.unassigned_folder)
                 if unassigned_count > 0:
                     f.write(f"\nUnassigned files: {unassigned_count}\n")
         
@@ -363,6 +782,10 @@ def main():
     parser.add_argument('--debug', action='store_true', default=True, help='Enable debug mode (default: enabled)')
     parser.add_argument('--max-files', type=int, help='Limit number of files to process (for testing)')
     parser.add_argument('--no-debug', action='store_true', help='Disable debug mode')
+    parser.add_argument('--workers', type=int, help='Number of parallel OCR processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the OCR cache')
+    parser.add_argument('--copy', action='store_true',
+                        help='Copy files into meeting folders instead of hardlinking them')
     
     args = parser.parse_args()
     
@@ -381,7 +804,9 @@ def main():
     print("-" * 50)
     
     # Create organizer and run
-    organizer = DebugMeetingMinutesOrganizer(args.source_folder, args.output_folder, debug_mode)
+    organizer = DebugMeetingMinutesOrganizer(args.source_folder, args.output_folder, debug_mode,
+                                             workers=args.workers, use_cache=not args.no_cache,
+                                             use_links=not args.copy)
     
     try:
         organizer.organize_files(args.max_files)
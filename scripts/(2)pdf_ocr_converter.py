@@ -5,7 +5,12 @@ Creates searchable PDFs from meeting minute images
 """
 # Use this format python pdf_converter.py E:\1974downloaded_pages\output#
 
+import hashlib
+import io
+import json
 import os
+import queue
+import threading
 import sys
 from pathlib import Path
 import argparse
@@ -16,47 +21,86 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.utils import ImageReader
 import tempfile
 import shutil
+import subprocess
+from contextlib import ExitStack
 from datetime import datetime
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _init_worker():
+    """Pool initializer: limit each tesseract to one thread"""
+    # One Tesseract thread per process - N single-threaded processes beat
+    # N processes each spinning up its own OpenMP thread pool
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+def _process_folder_worker(args):
+    """Process one meeting folder in a pool worker (module-level so it can be pickled)"""
+    settings, folder_path, images, ocr_method = args
+    converter = ImageToPDFConverter(**settings)
+    try:
+        return folder_path, converter.process_folder(folder_path, ocr_method, images=images)
+    except Exception as e:
+        logger.error(f"Error processing {folder_path.name}: {e}")
+        return folder_path, False
+
 class ImageToPDFConverter:
-    def __init__(self, base_folder, page_size='letter', dpi=300):
+    def __init__(self, base_folder, page_size='letter', dpi=300, workers=None, deskew=False,
+                 incremental=False, fast_model=False, tessdata_dir=None, overwrite=False, skip_existing=False):
         self.base_folder = Path(base_folder)
+        self.page_size_name = page_size
         self.page_size = letter if page_size.lower() == 'letter' else A4
         self.dpi = dpi
+        self.workers = workers or os.cpu_count() or 1
+        self.deskew = deskew
+        self.incremental = incremental
+        self.overwrite = overwrite
+        self.skip_existing = skip_existing
+        self._placements = {}
         
         # Supported image formats
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
         
-        # OCR configuration for better results
-        self.ocr_config = r'--oem 3 --psm 6 -c tessedit_create_searchable_pdf=1'
+        # OCR configuration for better results; the fast integer models are LSTM-only
+        self.fast_model = fast_model
+        self.tessdata_dir = tessdata_dir
+        oem = 1 if fast_model else 3
+        self.ocr_config = f'--oem {oem} --psm 6 -c tessedit_create_searchable_pdf=1'
+        if tessdata_dir:
+            # Both pytesseract and ocrmypdf start tesseract subprocesses, which read this
+            os.environ['TESSDATA_PREFIX'] = str(tessdata_dir)
         
     def get_meeting_folders(self):
-        """Get all folders that contain meeting images"""
+        """Get all folders that contain meeting images, as (folder, image_files) pairs"""
         meeting_folders = []
         
         for item in self.base_folder.iterdir():
             if item.is_dir() and item.name != "unassigned":
-                # Check if folder contains images
+                # Check if folder contains images (kept so the folder isn't listed twice)
                 image_files = self.get_image_files(item)
                 if image_files:
-                    meeting_folders.append(item)
+                    meeting_folders.append((item, image_files))
         
         # Sort folders by name (which should be date-based)
-        meeting_folders.sort()
+        meeting_folders.sort(key=lambda pair: pair[0])
         return meeting_folders
     
     def get_image_files(self, folder):
         """Get all image files in a folder, sorted by name"""
-        image_files = []
-        
-        for ext in self.image_extensions:
-            image_files.extend(list(folder.glob(f'*{ext}')))
-            image_files.extend(list(folder.glob(f'*{ext.upper()}')))
+        # One directory read with a case-insensitive extension check, rather than
+        # a glob per extension per case
+        with os.scandir(folder) as entries:
+            image_files = [Path(entry.path) for entry in entries
+                           if os.path.splitext(entry.name)[1].lower() in self.image_extensions
+                           and entry.is_file()]
         
         # Sort by filename to maintain page order
         image_files.sort(key=lambda x: x.name.lower())
@@ -64,32 +108,35 @@ class ImageToPDFConverter:
     
     def create_searchable_pdf_with_ocrmypdf(self, images, output_path):
         """Create searchable PDF using ocrmypdf (preferred method)"""
+        temp_pdf = None
         try:
             import ocrmypdf
             
-            # First create a simple PDF from images
-            temp_pdf = output_path.parent / f"temp_{output_path.name}"
-            
-            # Create PDF from images
-            self.create_simple_pdf(images, temp_pdf)
+            # ocrmypdf copies its input into its own work folder, so the image PDF is
+            # handed over in memory; a temp file is only needed for the reportlab fallback
+            with tempfile.TemporaryDirectory() as temp_dir:
+                input_pdf = self.image_pdf_stream(self.downsampled_images(images, temp_dir))
+            if input_pdf is None:
+                temp_pdf = output_path.parent / f"temp_{output_path.name}"
+                self.create_simple_pdf(images, temp_pdf)
+                input_pdf = temp_pdf
             
-            # Apply OCR to make it searchable
+            # Apply OCR to make it searchable (optimize=1 is lossless, so the scans
+            # are not re-encoded). The input is image-only, so skip_text OCRs every
+            # page without force_ocr's re-rasterizing; deskew is opt-in as it is
+            # costly and most scans are already straight
             ocrmypdf.ocr(
-                temp_pdf, 
+                input_pdf, 
                 output_path,
-                deskew=True,
-                auto_rotate_pages=True,
+                deskew=self.deskew,
+                rotate_pages=True,
                 remove_background=False,
                 optimize=1,
-                jpeg_quality=85,
-                png_quality=85,
                 language='eng',
-                force_ocr=True
+                skip_text=True,
+                tesseract_oem=1 if self.fast_model else None,
+                jobs=self.workers
             )
-            
-            # Clean up temp file
-            if temp_pdf.exists():
-                temp_pdf.unlink()
                 
             return True
             
@@ -99,51 +146,174 @@ class ImageToPDFConverter:
         except Exception as e:
             logger.error(f"OCR processing failed: {e}")
             return False
+        finally:
+            # Clean up temp file
+            if temp_pdf is not None and temp_pdf.exists():
+                temp_pdf.unlink()
+    
+    def image_pdf_stream(self, images):
+        """Build a PDF of the images in memory without re-encoding them, or None if img2pdf can't"""
+        try:
+            import img2pdf
+            
+            # JPEG/PNG streams are copied into the PDF untouched; same 20pt margins
+            # and fit-to-page layout as create_simple_pdf
+            layout = img2pdf.get_layout_fun(self.page_size, border=(20, 20))
+            stream = io.BytesIO()
+            img2pdf.convert([str(p) for p in images], layout_fun=layout, outputstream=stream)
+            stream.seek(0)
+            return stream
+            
+        except ImportError:
+            return None
+        except Exception as e:
+            # e.g. a format or colour mode img2pdf can't embed directly
+            logger.warning(f"img2pdf could not embed images ({e}), re-encoding with reportlab")
+            return None
     
     def create_simple_pdf(self, images, output_path):
         """Create a simple PDF from images"""
         c = canvas.Canvas(str(output_path), pagesize=self.page_size)
-        page_width, page_height = self.page_size
         
-        for i, image_path in enumerate(images):
+        # A loader thread opens (and, if needed, converts) the next images while
+        # reportlab compresses the current page; the small queue bounds memory
+        pages = queue.Queue(maxsize=2)
+        loader = threading.Thread(target=self._load_pages, args=(images, pages, {}), daemon=True)
+        loader.start()
+        
+        for i in range(len(images)):
+            image_path, page, error = pages.get()
             logger.info(f"  Processing image {i+1}/{len(images)}: {image_path.name}")
             
             try:
-                # Open and process image
-                with Image.open(image_path) as img:
-                    # Convert to RGB if necessary
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    
-                    # Calculate scaling to fit page while maintaining aspect ratio
-                    img_width, img_height = img.size
-                    
-                    # Calculate scale factor
-                    width_scale = (page_width - 40) / img_width  # 20pt margin on each side
-                    height_scale = (page_height - 40) / img_height  # 20pt margin on each side
-                    scale = min(width_scale, height_scale)
-                    
-                    # Calculate final dimensions
-                    final_width = img_width * scale
-                    final_height = img_height * scale
-                    
-                    # Center on page
-                    x = (page_width - final_width) / 2
-                    y = (page_height - final_height) / 2
-                    
-                    # Add image to PDF
-                    c.drawImage(ImageReader(img), x, y, final_width, final_height)
+                if error is not None:
+                    raise error
+                
+                # Scale to fit page while maintaining aspect ratio, centered
+                img_size, source = page
+                x, y, final_width, final_height = self.page_placement(img_size)
+                
+                # Add image to PDF
+                c.drawImage(source, x, y, final_width, final_height)
+                
+                # Add page break (except for last image)
+                if i < len(images) - 1:
+                    c.showPage()
                     
-                    # Add page break (except for last image)
-                    if i < len(images) - 1:
-                        c.showPage()
-                        
             except Exception as e:
                 logger.error(f"Error processing image {image_path}: {e}")
                 continue
         
+        loader.join()
         c.save()
     
+    def _load_pages(self, images, pages, seen):
+        """Put (image_path, (size, drawImage source), error) for each image on the pages queue"""
+        for image_path in images:
+            try:
+                pages.put((image_path, self._load_page(image_path, seen), None))
+            except Exception as e:
+                pages.put((image_path, None, e))
+    
+    def _load_page(self, image_path, seen):
+        """Return an image's size and the source to hand to drawImage
+        
+        seen maps file digests to the first path with those bytes in this PDF.
+        """
+        # Open image - only the header is read here, so size and mode
+        # are known without decoding any pixels
+        with Image.open(image_path) as img:
+            # Oversized scans are shrunk in memory rather than embedded full size
+            if self.downsample(img):
+                return img.size, ImageReader(img if img.mode in ('RGB', 'L') else img.convert('RGB'))
+            
+            # RGB/grayscale files are handed to reportlab by path (JPEGs are embedded
+            # without decoding); only other modes need converting to RGB first
+            if img.mode in ('RGB', 'L'):
+                # reportlab embeds each distinct path once, so byte-identical scans
+                # (e.g. repeated blank pages) share the first one's path
+                digest = hashlib.blake2b(image_path.read_bytes(), digest_size=16).digest()
+                return img.size, seen.setdefault(digest, str(image_path))
+            return img.size, ImageReader(img.convert('RGB'))
+    
+    def max_image_size(self, img_size):
+        """Return the largest (width, height) in pixels that fits the page at self.dpi"""
+        # Page size is in points (1/72 inch); orient the box the same way as the image
+        page_width, page_height = self.page_size
+        long_side = round(max(page_width, page_height) / 72 * self.dpi)
+        short_side = round(min(page_width, page_height) / 72 * self.dpi)
+        img_width, img_height = img_size
+        return (long_side, short_side) if img_width > img_height else (short_side, long_side)
+    
+    def downsample(self, img):
+        """Shrink img in place if it has more pixels than the page needs at self.dpi
+        
+        Returns True if the image was shrunk. A 600 DPI scan carries 4x the pixels
+        of a 300 DPI one through every later stage.
+        """
+        max_width, max_height = self.max_image_size(img.size)
+        if img.width <= max_width and img.height <= max_height:
+            return False
+        
+        # thumbnail() lets JPEGs decode at a reduced DCT scale before resampling
+        img.thumbnail((max_width, max_height), Image.LANCZOS)
+        return True
+    
+    def downsampled_images(self, images, temp_dir):
+        """Return images with any oversized ones replaced by shrunk copies saved in temp_dir"""
+        sources = []
+        for i, image_path in enumerate(images):
+            try:
+                with Image.open(image_path) as img:
+                    image_format = img.format
+                    original_width = img.width
+                    dpi = img.info.get('dpi')
+                    
+                    if self.downsample(img):
+                        # Keep the physical size: scale the recorded resolution with the pixels
+                        save_options = {}
+                        if dpi:
+                            factor = img.width / original_width
+                            save_options['dpi'] = (dpi[0] * factor, dpi[1] * factor)
+                        
+                        if image_format == 'JPEG':
+                            small_path = Path(temp_dir) / f"scaled_{i:03d}.jpg"
+                            img.save(small_path, quality=90, **save_options)
+                        else:
+                            small_path = Path(temp_dir) / f"scaled_{i:03d}.png"
+                            img.save(small_path, **save_options)
+                        image_path = small_path
+                        
+            except Exception as e:
+                logger.warning(f"Could not downsample {image_path}: {e}")
+            
+            sources.append(image_path)
+        return sources
+    
+    def page_placement(self, img_size):
+        """Return (x, y, width, height) that fits an image of img_size centered on the page"""
+        # Scanned pages nearly all share a few sizes, so each layout is computed once
+        placement = self._placements.get(img_size)
+        if placement is None:
+            page_width, page_height = self.page_size
+            img_width, img_height = img_size
+            
+            # Calculate scale factor
+            width_scale = (page_width - 40) / img_width  # 20pt margin on each side
+            height_scale = (page_height - 40) / img_height  # 20pt margin on each side
+            scale = min(width_scale, height_scale)
+            
+            # Calculate final dimensions
+            final_width = img_width * scale
+            final_height = img_height * scale
+            
+            # Center on page
+            x = (page_width - final_width) / 2
+            y = (page_height - final_height) / 2
+            
+            placement = self._placements[img_size] = (x, y, final_width, final_height)
+        return placement
+    
     def create_ocr_pdf_with_tesseract(self, images, output_path):
         """Create OCR'd PDF using tesseract directly"""
         try:
@@ -151,35 +321,48 @@ class ImageToPDFConverter:
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_dir_path = Path(temp_dir)
                 
-                # Process each image and extract text
-                pdf_pages = []
+                # OCR pages concurrently - tesseract runs outside the GIL, so threads
+                # are enough to keep every core busy
+                if self.workers > 1:
+                    # Concurrent tesseracts shouldn't each start their own OpenMP threads
+                    os.environ['OMP_THREAD_LIMIT'] = '1'
                 
-                for i, image_path in enumerate(images):
-                    logger.info(f"  OCR processing image {i+1}/{len(images)}: {image_path.name}")
-                    
-                    # Use tesseract to create searchable PDF for this image
-                    temp_pdf = temp_dir_path / f"page_{i:03d}"
-                    
-                    try:
-                        # Run tesseract OCR to create PDF
-                        pytesseract.run_tesseract(
-                            str(image_path),
-                            str(temp_pdf),
-                            extension='pdf',
-                            lang='eng',
-                            config=self.ocr_config
-                        )
-                        
-                        pdf_file = temp_pdf.with_suffix('.pdf')
-                        if pdf_file.exists():
-                            pdf_pages.append(pdf_file)
-                            
-                    except Exception as e:
-                        logger.error(f"OCR failed for {image_path}: {e}")
-                        continue
+                sources = self.downsampled_images(images, temp_dir_path)
+                pages = list(enumerate(zip(images, sources)))
+                
+                # With tesserocr, each thread reuses an in-process handle (model loaded
+                # once) and takes one page at a time. The tesseract CLI loads its model
+                # per run but accepts a list of images, so each thread gets one
+                # contiguous batch of pages instead
+                if PyTessBaseAPI is not None:
+                    tess_apis = queue.Queue()
+                    batch_size = 1
+                else:
+                    tess_apis = None
+                    batch_size = -(-len(pages) // self.workers)
+                batches = [pages[k:k + batch_size] for k in range(0, len(pages), batch_size)]
+                batch_pdfs = [None] * len(batches)
+                
+                try:
+                    with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                        futures = {
+                            executor.submit(self._ocr_pages, batch, temp_dir_path, tess_apis): n
+                            for n, batch in enumerate(batches)
+                        }
+                        for future in as_completed(futures):
+                            batch_pdfs[futures[future]] = future.result()
+                finally:
+                    while tess_apis is not None and not tess_apis.empty():
+                        tess_apis.get_nowait().End()
                 
-                # Combine all PDF pages
-                if pdf_pages:
+                # Keep page order; failed pages are already left out
+                pdf_pages = [pdf_file for pdfs in batch_pdfs for pdf_file in pdfs]
+                
+                # Combine all PDF pages (a single batch already is the whole document)
+                if len(pdf_pages) == 1:
+                    shutil.move(pdf_pages[0], output_path)
+                    return True
+                elif pdf_pages:
                     self.combine_pdfs(pdf_pages, output_path)
                     return True
                 else:
@@ -190,8 +373,115 @@ class ImageToPDFConverter:
             logger.error(f"Tesseract OCR processing failed: {e}")
             return False
     
+    def _ocr_pages(self, batch, temp_dir_path, tess_apis=None):
+        """OCR a batch of (index, (image_path, source)) pages, returning their PDFs in order
+        
+        Without tesserocr a multi-page batch is one tesseract run over a list file,
+        producing one PDF; if that fails the pages are retried one at a time.
+        """
+        if tess_apis is None and len(batch) > 1:
+            first, last = batch[0][0], batch[-1][0]
+            logger.info(f"  OCR processing images {first+1}-{last+1} in one tesseract run")
+            
+            list_file = temp_dir_path / f"batch_{first:03d}.txt"
+            list_file.write_text("\n".join(str(source) for _, (_, source) in batch) + "\n",
+                                 encoding='utf-8')
+            batch_pdf = temp_dir_path / f"batch_{first:03d}"
+            try:
+                pytesseract.pytesseract.run_tesseract(
+                    str(list_file),
+                    str(batch_pdf),
+                    extension='pdf',
+                    lang='eng',
+                    config=self.ocr_config
+                )
+                if batch_pdf.with_suffix('.pdf').exists():
+                    return [batch_pdf.with_suffix('.pdf')]
+            except Exception as e:
+                logger.warning(f"Batch OCR failed for images {first+1}-{last+1} ({e}), retrying one at a time")
+        
+        pdfs = (self._ocr_one_page(image_path, temp_dir_path, i, source, tess_apis)
+                for i, (image_path, source) in batch)
+        return [pdf_file for pdf_file in pdfs if pdf_file is not None]
+    
+    def _ocr_one_page(self, image_path, temp_dir_path, i, source=None, tess_apis=None):
+        """OCR one image (read from source if given) into a single-page searchable PDF
+        
+        tess_apis is a queue of idle tesserocr handles to use instead of the tesseract
+        CLI. Returns the PDF's path, or None if OCR failed.
+        """
+        logger.info(f"  OCR processing image {i+1}: {image_path.name}")
+        
+        # Use tesseract to create searchable PDF for this image
+        temp_pdf = temp_dir_path / f"page_{i:03d}"
+        
+        try:
+            # Run tesseract OCR to create PDF
+            if tess_apis is not None:
+                self._ocr_page_with_tesserocr(str(source or image_path), str(temp_pdf), tess_apis)
+            else:
+                pytesseract.pytesseract.run_tesseract(
+                    str(source or image_path),
+                    str(temp_pdf),
+                    extension='pdf',
+                    lang='eng',
+                    config=self.ocr_config
+                )
+            
+            pdf_file = temp_pdf.with_suffix('.pdf')
+            if pdf_file.exists():
+                return pdf_file
+                
+        except Exception as e:
+            logger.error(f"OCR failed for {image_path}: {e}")
+        
+        return None
+    
+    def _ocr_page_with_tesserocr(self, image_file, output_base, tess_apis):
+        """Write output_base.pdf for one image using an idle tesserocr handle from tess_apis"""
+        try:
+            api = tess_apis.get_nowait()
+        except queue.Empty:
+            options = {'path': str(self.tessdata_dir)} if self.tessdata_dir else {}
+            api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK,
+                                oem=OEM.LSTM_ONLY if self.fast_model else OEM.DEFAULT, **options)
+            api.SetVariable('tessedit_create_pdf', 'true')
+        
+        try:
+            if not api.ProcessPages(output_base, image_file):
+                raise RuntimeError("tesserocr could not render the page")
+        finally:
+            tess_apis.put(api)
+    
     def combine_pdfs(self, pdf_files, output_path):
         """Combine multiple PDF files into one"""
+        qpdf = shutil.which('qpdf')
+        if qpdf:
+            # Native page copy with no Python-side parsing; exit code 3 means
+            # qpdf succeeded but had warnings about the input
+            result = subprocess.run(
+                [qpdf, '--empty', '--linearize', '--pages', *map(str, pdf_files), '--', str(output_path)],
+                capture_output=True, text=True
+            )
+            if result.returncode in (0, 3):
+                return
+            logger.warning(f"qpdf merge failed ({result.stderr.strip()}), trying pikepdf/PyPDF2")
+        
+        try:
+            import pikepdf
+            
+            # QPDF copies page objects across without building a Python object graph;
+            # sources must stay open until the combined file is saved
+            with ExitStack() as stack, pikepdf.Pdf.new() as combined:
+                for pdf_file in pdf_files:
+                    source = stack.enter_context(pikepdf.Pdf.open(pdf_file))
+                    combined.pages.extend(source.pages)
+                combined.save(output_path, linearize=True)
+            return
+            
+        except ImportError:
+            pass
+        
         try:
             from PyPDF2 import PdfMerger
             
@@ -206,20 +496,24 @@ class ImageToPDFConverter:
             merger.close()
             
         except ImportError:
-            logger.error("PyPDF2 not available for PDF merging")
+            logger.error("Neither pikepdf nor PyPDF2 available for PDF merging")
             # Fallback: just copy the first PDF if there's only one
             if len(pdf_files) == 1:
                 shutil.copy2(pdf_files[0], output_path)
             else:
-                raise Exception("Cannot combine PDFs without PyPDF2")
+                raise Exception("Cannot combine PDFs without pikepdf or PyPDF2")
     
-    def process_folder(self, folder_path, ocr_method='auto'):
-        """Process a single folder to create OCR'd PDF"""
+    def process_folder(self, folder_path, ocr_method='auto', images=None):
+        """Process a single folder to create OCR'd PDF
+        
+        images is the folder's image list if already collected, otherwise it is read here.
+        """
         folder_name = folder_path.name
         logger.info(f"Processing folder: {folder_name}")
         
         # Get all image files
-        images = self.get_image_files(folder_path)
+        if images is None:
+            images = self.get_image_files(folder_path)
         
         if not images:
             logger.warning(f"No images found in {folder_name}")
@@ -228,15 +522,17 @@ class ImageToPDFConverter:
         logger.info(f"Found {len(images)} images")
         
         # Create output PDF path
-        pdf_filename = f"{folder_name}_meeting_minutes.pdf"
-        output_path = folder_path / pdf_filename
+        output_path = self.output_pdf_path(folder_path)
+        pdf_filename = output_path.name
         
         # Check if PDF already exists
-        if output_path.exists():
-            response = input(f"PDF already exists: {pdf_filename}. Overwrite? (y/n): ")
-            if response.lower() != 'y':
-                logger.info(f"Skipping {folder_name}")
-                return False
+        if self.is_up_to_date(output_path, images):
+            logger.info(f"Up to date, skipping {folder_name}")
+            return True
+        
+        if output_path.exists() and not self.replaces_existing():
+            logger.info(f"PDF already exists, skipping {folder_name} (use --overwrite to replace it)")
+            return False
         
         # Try different OCR methods
         success = False
@@ -264,21 +560,61 @@ class ImageToPDFConverter:
             logger.error(f"❌ Failed to create PDF for {folder_name}")
             return False
     
+    def replaces_existing(self):
+        """Whether an existing PDF that isn't up to date gets rebuilt: always with --overwrite,
+        and in incremental mode (where only stale PDFs get this far) unless --skip-existing"""
+        return self.overwrite or (self.incremental and not self.skip_existing)
+    
+    def is_up_to_date(self, output_path, images):
+        """Return True in incremental mode if output_path is newer than every image"""
+        if not self.incremental or not output_path.exists():
+            return False
+        pdf_mtime = output_path.stat().st_mtime
+        return all(img.stat().st_mtime <= pdf_mtime for img in images)
+    
     def create_summary_file(self, folder_path, images, pdf_path):
         """Create a summary text file with basic info"""
         summary_path = folder_path / f"{folder_path.name}_summary.txt"
         
+        lines = [
+            "Meeting Minutes Summary",
+            f"{'=' * 30}\n",
+            f"Meeting Date: {folder_path.name}",
+            f"PDF Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Total Pages: {len(images)}",
+            f"PDF File: {pdf_path.name}\n",
+            "Source Images:",
+        ]
+        lines.extend(f"  {i:2d}. {img.name}" for i, img in enumerate(images, 1))
+        
+        # Built up front and written in one go
         with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(f"Meeting Minutes Summary\n")
-            f.write(f"{'=' * 30}\n\n")
-            f.write(f"Meeting Date: {folder_path.name}\n")
-            f.write(f"PDF Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Pages: {len(images)}\n")
-            f.write(f"PDF File: {pdf_path.name}\n\n")
-            
-            f.write("Source Images:\n")
-            for i, img in enumerate(images, 1):
-                f.write(f"  {i:2d}. {img.name}\n")
+            f.write("\n".join(lines) + "\n")
+    
+    def write_manifest(self, done):
+        """Write one JSON manifest describing every meeting PDF in the batch
+        
+        done is a list of (folder, images) pairs whose PDF is in place.
+        """
+        records = []
+        for folder, images in sorted(done, key=lambda pair: pair[0]):
+            pdf_path = self.output_pdf_path(folder)
+            records.append({
+                'meeting_date': folder.name,
+                'pdf_file': str(pdf_path),
+                'pdf_created': datetime.fromtimestamp(pdf_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                'total_pages': len(images),
+                'source_images': [img.name for img in images],
+            })
+        
+        manifest_path = self.base_folder / "meeting_minutes_manifest.json"
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+        logger.info(f"📄 Manifest written: {manifest_path}")
+    
+    def output_pdf_path(self, folder_path):
+        """Return the meeting PDF path for a folder"""
+        return folder_path / f"{folder_path.name}_meeting_minutes.pdf"
     
     def process_all_folders(self, ocr_method='auto'):
         """Process all meeting folders"""
@@ -290,25 +626,82 @@ class ImageToPDFConverter:
         
         logger.info(f"Found {len(meeting_folders)} meeting folders to process")
         
-        successful = 0
+        done = []
         failed = 0
         
-        for folder in meeting_folders:
-            try:
-                if self.process_folder(folder, ocr_method):
-                    successful += 1
-                else:
+        if self.workers > 1 and len(meeting_folders) > 1:
+            done, failed = self._process_folders_parallel(meeting_folders, ocr_method)
+        else:
+            for folder, images in meeting_folders:
+                try:
+                    if self.process_folder(folder, ocr_method, images=images):
+                        done.append((folder, images))
+                    else:
+                        failed += 1
+                except KeyboardInterrupt:
+                    logger.info("Process interrupted by user")
+                    break
+                except Exception as e:
+                    logger.error(f"Error processing {folder.name}: {e}")
                     failed += 1
-            except KeyboardInterrupt:
-                logger.info("Process interrupted by user")
-                break
-            except Exception as e:
-                logger.error(f"Error processing {folder.name}: {e}")
-                failed += 1
+        
+        if done:
+            self.write_manifest(done)
         
         logger.info(f"\nProcessing complete!")
-        logger.info(f"✅ Successful: {successful}")
+        logger.info(f"✅ Successful: {len(done)}")
         logger.info(f"❌ Failed: {failed}")
+    
+    def _process_folders_parallel(self, meeting_folders, ocr_method):
+        """Process meeting folders in a pool of worker processes, one tesseract per core
+        
+        Returns the (folder, images) pairs that succeeded and the number that failed.
+        """
+        tasks = []
+        done = []
+        failed = 0
+        for folder, images in meeting_folders:
+            # Folders that would be skipped anyway aren't sent to the pool
+            output_path = self.output_pdf_path(folder)
+            if self.is_up_to_date(output_path, images):
+                logger.info(f"Up to date, skipping {folder.name}")
+                done.append((folder, images))
+                continue
+            if output_path.exists() and not self.replaces_existing():
+                logger.info(f"PDF already exists, skipping {folder.name} (use --overwrite to replace it)")
+                failed += 1
+                continue
+            tasks.append((folder, images))
+        
+        if not tasks:
+            return done, failed
+        
+        # Split the cores between folder processes and each folder's page threads
+        processes = min(self.workers, len(tasks))
+        page_workers = max(1, self.workers // processes)
+        settings = dict(base_folder=self.base_folder, page_size=self.page_size_name, dpi=self.dpi,
+                        workers=page_workers, deskew=self.deskew, incremental=self.incremental,
+                        overwrite=self.overwrite, skip_existing=self.skip_existing,
+                        fast_model=self.fast_model, tessdata_dir=self.tessdata_dir)
+        images_by_folder = dict(tasks)
+        tasks = [(settings, folder, images, ocr_method) for folder, images in tasks]
+        logger.info(f"Processing {len(tasks)} folders with {processes} workers")
+        
+        # Executor workers aren't daemonic, so ocrmypdf can still start its own page workers
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as executor:
+            futures = [executor.submit(_process_folder_worker, task) for task in tasks]
+            try:
+                for future in as_completed(futures):
+                    folder, ok = future.result()
+                    if ok:
+                        done.append((folder, images_by_folder[folder]))
+                    else:
+                        failed += 1
+            except KeyboardInterrupt:
+                logger.info("Process interrupted by user")
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        return done, failed
 
 def check_dependencies():
     """Check if required packages are installed"""
@@ -320,6 +713,9 @@ def check_dependencies():
     
     optional = {
         'ocrmypdf': 'ocrmypdf (recommended for best OCR)',
+        'img2pdf': 'img2pdf (lossless image embedding for ocrmypdf)',
+        'tesserocr': 'tesserocr (in-process Tesseract for the tesseract method)',
+        'pikepdf': 'pikepdf (fast PDF merging)',
         'PyPDF2': 'PyPDF2 (for PDF merging)'
     }
     
@@ -360,7 +756,22 @@ def main():
                         default='auto', help='OCR method to use (default: auto)')
     parser.add_argument('--page-size', choices=['letter', 'a4'], default='letter',
                         help='PDF page size (default: letter)')
-    parser.add_argument('--dpi', type=int, default=300, help='DPI for image processing (default: 300)')
+    parser.add_argument('--dpi', type=int, default=300, help='Scans with more detail than this are downsampled (default: 300)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Folders to process in parallel (default: all CPU cores)')
+    parser.add_argument('--deskew', action='store_true',
+                        help='Straighten skewed scans before OCR (ocrmypdf only, slower)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip folders whose PDF is newer than all of their images and rebuild the rest')
+    parser.add_argument('--fast-model', action='store_true',
+                        help='Use the LSTM-only engine (pair with --tessdata-dir pointing at tessdata_fast)')
+    parser.add_argument('--tessdata-dir', default=None,
+                        help='Tesseract model folder, e.g. a tessdata_fast download (sets TESSDATA_PREFIX)')
+    existing = parser.add_mutually_exclusive_group()
+    existing.add_argument('--overwrite', action='store_true',
+                          help='Replace meeting PDFs that already exist')
+    existing.add_argument('--skip-existing', action='store_true',
+                          help='Leave existing meeting PDFs alone, even stale ones with --incremental')
     parser.add_argument('--check-deps', action='store_true', help='Check dependencies and exit')
     
     args = parser.parse_args()
@@ -389,7 +800,14 @@ def main():
     converter = ImageToPDFConverter(
         args.folder_path, 
         page_size=args.page_size,
-        dpi=args.dpi
+        dpi=args.dpi,
+        workers=args.workers,
+        deskew=args.deskew,
+        incremental=args.incremental,
+        overwrite=args.overwrite,
+        skip_existing=args.skip_existing,
+        fast_model=args.fast_model,
+        tessdata_dir=args.tessdata_dir
     )
     
     try:
@@ -11,11 +11,19 @@ import argparse
 import logging
 from datetime import datetime
 import shutil
-import tempfile
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+from collections import deque
+from contextlib import ExitStack, nullcontext
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
+try:
+    from blake3 import blake3 as content_hash
+except ImportError:
+    from hashlib import sha256 as content_hash
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -26,6 +34,13 @@ def setup_tesseract_path():
     try:
         import pytesseract
         
+        # Already resolved by the parent process; pool workers re-import this module
+        # on Windows, and re-detecting would cost each of them a subprocess or two
+        cached_cmd = os.environ.get('TESSERACT_CMD')
+        if cached_cmd:
+            pytesseract.pytesseract.tesseract_cmd = cached_cmd
+            return True
+        
         # Common Tesseract installation paths on Windows
         possible_paths = [
             r"C:\Program Files\Tesseract-OCR\tesseract.exe",
@@ -39,6 +54,7 @@ def setup_tesseract_path():
             result = subprocess.run(['tesseract', '--version'], capture_output=True, text=True)
             if result.returncode == 0:
                 logger.info("✅ Tesseract found in system PATH")
+                os.environ['TESSERACT_CMD'] = pytesseract.pytesseract.tesseract_cmd
                 return True
         except FileNotFoundError:
             pass
@@ -54,6 +70,7 @@ def setup_tesseract_path():
                 try:
                     version = pytesseract.get_tesseract_version()
                     logger.info(f"✅ Tesseract version: {version}")
+                    os.environ['TESSERACT_CMD'] = expanded_path
                     return True
                 except Exception as e:
                     logger.warning(f"Tesseract found but not working: {e}")
@@ -71,12 +88,140 @@ def setup_tesseract_path():
 # Set up Tesseract when module is imported
 setup_tesseract_path()
 
+# Render resolution for OCR: Tesseract's accuracy levels off around 200 DPI for
+# typical 10-12pt print, and 300 DPI means 2.25x the pixels to push through it
+OCR_DPI = 200
+
+# Pages per tesseract run: enough to amortize its startup and model load,
+# few enough that the in-memory TIFF for a batch stays small
+OCR_BATCH_SIZE = 8
+
+# Bump when a change to the OCR output should invalidate cached results
+OCR_CACHE_VERSION = 1
+
+def _init_worker():
+    """Pool initializer: limit each tesseract to one thread"""
+    # N single-threaded tesseracts beat N tesseracts each running its own OpenMP pool
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+def _init_file_worker(tess_threads):
+    """Pool initializer: give each file's tesseract its share of the cores"""
+    os.environ['OMP_THREAD_LIMIT'] = str(tess_threads)
+
+def _page_image(img_file):
+    """Open a page image file, or pass through a page already rendered in memory"""
+    from PIL import Image
+    
+    if isinstance(img_file, Image.Image):
+        return nullcontext(img_file)
+    return Image.open(img_file)
+
+def _ocr_page_image(img_file):
+    """OCR one page image in a pool worker (module-level so it can be pickled)"""
+    import pytesseract
+    
+    try:
+        with _page_image(img_file) as img:
+            return pytesseract.image_to_string(img, lang='eng', config=r'--oem 3 --psm 6')
+    except Exception as e:
+        logger.warning(f"  OCR failed for {getattr(img_file, 'name', 'rendered page')}: {e}")
+        return ""  # Empty text for failed pages
+
+def _ocr_page_to_pdf(img_file):
+    """OCR one page image into a one-page PDF with tesseract's own text layer"""
+    import pytesseract
+    
+    try:
+        with _page_image(img_file) as img:
+            # Tesseract sizes the PDF page from the render resolution
+            return pytesseract.image_to_pdf_or_hocr(img, lang='eng', extension='pdf',
+                                                    config=f'--oem 3 --psm 6 --dpi {OCR_DPI}')
+    except Exception as e:
+        logger.warning(f"  OCR failed for {getattr(img_file, 'name', 'rendered page')}: {e}")
+        return None
+
+def _run_tesseract_batch(pages, extension):
+    """OCR several pages in one tesseract run, sent as a multi-page TIFF on stdin"""
+    import pytesseract
+    
+    tiff = io.BytesIO()
+    with ExitStack() as stack:
+        images = [stack.enter_context(_page_image(page)) for page in pages]
+        # Uncompressed frames: nothing to encode here or decode in tesseract
+        images[0].save(tiff, 'TIFF', save_all=True, append_images=images[1:], dpi=(OCR_DPI, OCR_DPI))
+    
+    cmd = [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout',
+           '-l', 'eng', '--oem', '3', '--psm', '6', '--dpi', str(OCR_DPI)]
+    if extension == 'pdf':
+        cmd.append('pdf')
+    result = subprocess.run(cmd, input=tiff.getvalue(), capture_output=True, check=True)
+    return result.stdout
+
+def _ocr_batch_text(pages):
+    """OCR a batch of pages to text, falling back to one tesseract run per page"""
+    try:
+        # Tesseract ends every page's text with a form feed
+        texts = _run_tesseract_batch(pages, 'txt').decode('utf-8').split('\f')
+        if len(texts) > len(pages):
+            return texts[:len(pages)]
+        logger.info(f"  Batch OCR returned {len(texts) - 1} pages for {len(pages)}, OCR'ing pages one by one")
+    except Exception as e:
+        logger.info(f"  Batch OCR failed, OCR'ing pages one by one: {e}")
+    return [_ocr_page_image(page) for page in pages]
+
+def _ocr_batch_to_pdf(pages):
+    """OCR a batch of pages into PDF, falling back to one tesseract run per page"""
+    try:
+        return [_run_tesseract_batch(pages, 'pdf')]
+    except Exception as e:
+        logger.info(f"  Batch OCR failed, OCR'ing pages one by one: {e}")
+    return [_ocr_page_to_pdf(page) for page in pages]
+
+def _ocr_page_with_pymupdf(args):
+    """Render and OCR one page with PyMuPDF's built-in Tesseract, returning a one-page PDF"""
+    import fitz  # PyMuPDF
+    
+    input_path, page_num = args
+    with fitz.open(input_path) as doc:
+        pix = doc.load_page(page_num).get_pixmap(dpi=OCR_DPI)
+    # Image plus an invisible, correctly positioned text layer, built in memory
+    return pix.pdfocr_tobytes(compress=True, language='eng')
+
+def _page_pool(workers):
+    """Process pool for one file's page-level OCR; use it in a with block"""
+    # Shut down per file: a pool left running in a file worker would keep that
+    # worker from exiting, and with it the outer --parallel pool
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+def _process_pdf_worker(settings, pdf_path, method):
+    """Process one PDF in a pool worker and hand its result back to the parent"""
+    processor = FixedBatchPDFOCR(**settings)
+    try:
+        return processor.process_single_pdf(pdf_path, method)
+    except Exception as e:
+        logger.error(f"Error processing {pdf_path.name}: {e}")
+        return 'failed'
+
 class FixedBatchPDFOCR:
-    def __init__(self, base_folder, output_suffix="_ocr", backup_originals=True, max_workers=2):
+    def __init__(self, base_folder, output_suffix="_ocr", backup_originals=True, max_workers=2,
+                 page_workers=None, cache_dir='.ocr_cache', tess_threads=None,
+                 deskew=False, rotate_pages=False, clean=False):
         self.base_folder = Path(base_folder)
         self.output_suffix = output_suffix
         self.backup_originals = backup_originals
         self.max_workers = max_workers
+        # ocrmypdf image preprocessing; each is a full extra pass per page, so opt-in
+        self.deskew = deskew
+        self.rotate_pages = rotate_pages
+        self.clean = clean
+        self.page_workers = page_workers or os.cpu_count() or 1
+        # Tesseract's OpenMP pool defaults to every core, which is right for one file at
+        # a time; process_parallel splits the cores unless a limit is given here
+        self.tess_threads = tess_threads
+        if tess_threads:
+            os.environ['OMP_THREAD_LIMIT'] = str(tess_threads)
+        # OCR'd outputs keyed by the hash of their input, so re-runs skip unchanged files
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
         # Statistics
         self.stats = {
@@ -90,14 +235,31 @@ class FixedBatchPDFOCR:
     def find_pdf_files(self):
         """Find all PDF files in the directory structure"""
         pdf_files = []
+        # The cache may live inside the folder being scanned
+        cache_dir = self.cache_dir.absolute() if self.cache_dir else None
+        # One C-level endswith over a tuple, including outputs from a custom --output-suffix
+        skip_suffixes = ('_backup.pdf', '_ocr.pdf')
+        if self.output_suffix:
+            skip_suffixes += (f"{self.output_suffix}.pdf",)
         
-        for pdf_file in self.base_folder.rglob("*.pdf"):
-            # Skip backup files and already OCR'd files
-            if not (pdf_file.name.endswith('_backup.pdf') or 
-                   pdf_file.name.endswith('_ocr.pdf') or
-                   pdf_file.name.startswith('temp_') or
-                   '.backup' in pdf_file.name):
-                pdf_files.append(pdf_file)
+        # One scandir pass per folder; DirEntry caches the file type, so
+        # non-PDFs cost no stat at all
+        pending = [self.base_folder]
+        while pending:
+            folder = pending.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.lower().endswith('.pdf') and entry.is_file():
+                            # Skip backup files and already OCR'd files
+                            if not (name.endswith(skip_suffixes) or name.startswith('temp_') or
+                                    '.backup' in name):
+                                pdf_files.append(Path(entry.path))
+                        elif entry.is_dir() and Path(entry.path).absolute() != cache_dir:
+                            pending.append(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not list {folder}: {e}")
         
         # Sort by name for consistent processing order
         pdf_files.sort()
@@ -108,30 +270,50 @@ class FixedBatchPDFOCR:
     def check_if_pdf_has_text(self, pdf_path):
         """Check if PDF already contains searchable text"""
         try:
-            import PyPDF2
+            import fitz  # PyMuPDF
+            
+            # Text needs a font: reading the page resources is enough, and
+            # far cheaper than decompressing content streams to extract text
+            with fitz.open(str(pdf_path)) as doc:
+                return any(page.get_fonts() for page in doc.pages(stop=min(3, len(doc))))
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not check fonts of {pdf_path.name}: {e}")
+            return False
+        
+        try:
+            try:
+                import pypdf
+            except ImportError:
+                import PyPDF2 as pypdf  # Older installs; same reader API
             
             with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
+                # Non-strict parsing skips validation we don't need for a text probe
+                reader = pypdf.PdfReader(file, strict=False)
                 
                 # Check first few pages for text
                 pages_to_check = min(3, len(reader.pages))
-                total_text = ""
+                total_chars = 0
                 
                 for i in range(pages_to_check):
                     page = reader.pages[i]
-                    text = page.extract_text().strip()
-                    total_text += text
-                
-                # If we found substantial text, assume it's already OCR'd
-                # Meeting minutes should have plenty of text
-                if len(total_text) > 100:  # At least 100 characters
-                    return True
+                    total_chars += len(page.extract_text().strip())
+                    
+                    # If we found substantial text, assume it's already OCR'd
+                    # Meeting minutes should have plenty of text; stop parsing pages once we know
+                    if total_chars > 100:  # At least 100 characters
+                        return True
                     
         except Exception as e:
             logger.warning(f"Could not check text content of {pdf_path.name}: {e}")
         
         return False
     
+    def ocrmypdf_jobs(self):
+        """ocrmypdf page workers that, times the tesseract threads each, fill this file's cores"""
+        return max(1, self.page_workers // (self.tess_threads or 1))
+    
     def ocr_pdf_with_ocrmypdf_fixed(self, input_path, output_path):
         """OCR PDF using ocrmypdf with version compatibility fixes"""
         try:
@@ -143,13 +325,14 @@ class FixedBatchPDFOCR:
                     input_path,
                     output_path,
                     language='eng',
-                    rotate_pages=True,
-                    deskew=True,
-                    auto_rotate_pages=True,
-                    force_ocr=False,  # Skip if already has text
-                    skip_text=False,
-                    clean=True,
-                    optimize=1
+                    rotate_pages=self.rotate_pages,
+                    deskew=self.deskew,
+                    skip_text=True,  # Pages that already have text are passed through
+                    clean=self.clean,
+                    optimize=0,  # No image recompression pass
+                    output_type='pdf',  # Skip the PDF/A conversion
+                    fast_web_view=999999,  # Threshold in MB: never linearize
+                    jobs=self.ocrmypdf_jobs()
                 )
                 return True
             except Exception as e:
@@ -160,7 +343,8 @@ class FixedBatchPDFOCR:
                         input_path,
                         output_path,
                         language='eng',
-                        force_ocr=False
+                        skip_text=True,
+                        jobs=self.ocrmypdf_jobs()
                     )
                     return True
                 except Exception as e2:
@@ -178,133 +362,176 @@ class FixedBatchPDFOCR:
                 logger.error(f"  ocrmypdf failed: {e}")
                 return False
     
+    def map_pages(self, func, pages):
+        """Apply func to every page, across the page pool when there is more than one page"""
+        # Pages are independent, so spread them over processes; map keeps page order
+        if self.page_workers > 1 and len(pages) > 1:
+            with _page_pool(self.page_workers) as pool:
+                return list(pool.map(func, pages))
+        return [func(page) for page in pages]
+    
+    def ocr_pdf_with_pymupdf(self, input_path, output_path):
+        """OCR each page with PyMuPDF and write the OCR'd pages straight into a new PDF"""
+        import fitz  # PyMuPDF
+        
+        with fitz.open(str(input_path)) as doc:
+            page_count = len(doc)
+        logger.info(f"  Running PyMuPDF OCR on {page_count} pages...")
+        
+        tasks = [(str(input_path), page_num) for page_num in range(page_count)]
+        page_pdfs = self.map_pages(_ocr_page_with_pymupdf, tasks)
+        
+        with fitz.open() as out:
+            for page_pdf in page_pdfs:
+                with fitz.open("pdf", page_pdf) as page_doc:
+                    out.insert_pdf(page_doc)
+            out.save(str(output_path), garbage=4, deflate=True)
+        
+        logger.info("  ✅ Searchable PDF created successfully")
+        return True
+    
+    def page_count(self, input_path):
+        """Number of pages in a PDF, or None if no reader can tell"""
+        try:
+            import fitz  # PyMuPDF
+            with fitz.open(str(input_path)) as doc:
+                return len(doc)
+        except Exception:
+            pass
+        try:
+            import pypdf
+            return len(pypdf.PdfReader(str(input_path), strict=False).pages)
+        except Exception:
+            return None
+    
+    def _render_with_pdf2image(self, input_path):
+        """Yield page images from pdf2image (requires poppler), a few pages per call"""
+        from pdf2image import convert_from_path, pdfinfo_from_path
+        
+        page_count = pdfinfo_from_path(input_path)['Pages']
+        for first_page in range(1, page_count + 1, OCR_BATCH_SIZE):
+            last_page = min(first_page + OCR_BATCH_SIZE - 1, page_count)
+            # Without an output_folder the pages come back as PIL images
+            yield from convert_from_path(input_path, dpi=OCR_DPI, first_page=first_page,
+                                         last_page=last_page, thread_count=2)
+    
+    def _render_with_pymupdf(self, input_path):
+        """Yield page images rendered by PyMuPDF"""
+        import fitz  # PyMuPDF
+        from PIL import Image
+        
+        mat = fitz.Matrix(OCR_DPI/72, OCR_DPI/72)
+        with fitz.open(str(input_path)) as doc:
+            for page in doc:
+                pix = page.get_pixmap(matrix=mat, alpha=False)
+                # Wrap the raw RGB samples; no PNG encode, no file to re-read
+                yield Image.frombytes('RGB', (pix.width, pix.height), pix.samples)
+    
+    def render_pages(self, input_path):
+        """Yield page images one at a time from the first rasterizer that works"""
+        renderers = [('pdf2image', self._render_with_pdf2image),
+                     ('PyMuPDF', self._render_with_pymupdf)]
+        for name, render in renderers:
+            pages = render(input_path)
+            # Fall through to the next rasterizer only if this one can't produce a first page
+            try:
+                first_page = next(pages)
+            except StopIteration:
+                logger.info(f"  {name} produced no pages")
+                continue
+            except ImportError:
+                logger.info(f"  {name} not available")
+                continue
+            except Exception as e:
+                logger.info(f"  {name} failed: {e}")
+                continue
+            logger.info(f"  Converting PDF to images using {name}...")
+            yield first_page
+            yield from pages
+            return
+        raise RuntimeError("Could not convert PDF to images")
+    
+    def ocr_page_stream(self, pages, ocr_batch, batch_size):
+        """OCR pages in batches as they are rendered, yielding (batch, results) in page order"""
+        pages = iter(pages)
+        if self.page_workers <= 1:
+            while batch := list(islice(pages, batch_size)):
+                yield batch, ocr_batch(batch)
+            return
+        
+        # Rendering carries on while earlier batches OCR in the pool; the bounded
+        # window is the back-pressure that keeps only a few pages in memory
+        max_in_flight = 2 * self.page_workers
+        in_flight = deque()
+        with _page_pool(self.page_workers) as pool:
+            while batch := list(islice(pages, batch_size)):
+                in_flight.append((batch, pool.submit(ocr_batch, batch)))
+                if len(in_flight) >= max_in_flight:
+                    batch, future = in_flight.popleft()
+                    yield batch, future.result()
+            while in_flight:
+                batch, future = in_flight.popleft()
+                yield batch, future.result()
+    
     def pdf_to_images_and_ocr(self, input_path, output_path):
         """Convert PDF to images first, then OCR each image and recombine"""
+        # PyMuPDF does render -> OCR -> PDF in memory; the image round-trip below is the fallback
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                images_dir = temp_path / "images"
-                images_dir.mkdir()
-                
-                # Step 1: Convert PDF to images using pdf2image or pymupdf
-                success = False
-                
-                # Try pdf2image first (requires poppler)
-                if not success:
-                    try:
-                        from pdf2image import convert_from_path
-                        logger.info("  Converting PDF to images using pdf2image...")
-                        
-                        images = convert_from_path(
-                            input_path,
-                            dpi=300,
-                            output_folder=images_dir,
-                            fmt='png',
-                            thread_count=2
-                        )
-                        
-                        # Save images with proper names
-                        image_files = []
-                        for i, image in enumerate(images):
-                            img_path = images_dir / f"page_{i:03d}.png"
-                            image.save(img_path, 'PNG')
-                            image_files.append(img_path)
-                        
-                        success = True
-                        logger.info(f"  Created {len(image_files)} images")
-                        
-                    except ImportError:
-                        logger.info("  pdf2image not available")
-                    except Exception as e:
-                        logger.info(f"  pdf2image failed: {e}")
-                
-                # Try pymupdf (fitz) as backup
-                if not success:
-                    try:
-                        import fitz  # PyMuPDF
-                        logger.info("  Converting PDF to images using PyMuPDF...")
-                        
-                        doc = fitz.open(str(input_path))
-                        image_files = []
-                        
-                        for page_num in range(len(doc)):
-                            page = doc.load_page(page_num)
-                            # Render page to an image
-                            mat = fitz.Matrix(300/72, 300/72)  # 300 DPI
-                            pix = page.get_pixmap(matrix=mat)
-                            
-                            img_path = images_dir / f"page_{page_num:03d}.png"
-                            pix.save(str(img_path))
-                            image_files.append(img_path)
-                        
-                        doc.close()
-                        success = True
-                        logger.info(f"  Created {len(image_files)} images")
-                        
-                    except ImportError:
-                        logger.info("  PyMuPDF not available")
-                    except Exception as e:
-                        logger.info(f"  PyMuPDF failed: {e}")
-                
-                # Try PIL + pdf2image alternative
-                if not success:
-                    logger.info("  Trying alternative PDF conversion method...")
-                    try:
-                        # Use subprocess to call external tools if available
-                        cmd = [
-                            'magick', 'convert',
-                            '-density', '300',
-                            str(input_path),
-                            str(images_dir / 'page_%03d.png')
-                        ]
-                        
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-                        if result.returncode == 0:
-                            image_files = sorted(list(images_dir.glob("page_*.png")))
-                            if image_files:
-                                success = True
-                                logger.info(f"  Created {len(image_files)} images using ImageMagick")
-                    except Exception as e:
-                        logger.info(f"  ImageMagick failed: {e}")
-                
-                if not success:
-                    logger.error("  Could not convert PDF to images")
-                    return False
-                
-                # Step 2: OCR each image using tesseract
-                logger.info("  Running OCR on images...")
-                ocr_texts = []
-                
-                import pytesseract
-                from PIL import Image
-                
-                for img_file in image_files:
-                    try:
-                        # Extract text from image
-                        text = pytesseract.image_to_string(
-                            Image.open(img_file),
-                            lang='eng',
-                            config=r'--oem 3 --psm 6'
-                        )
-                        ocr_texts.append(text)
-                    except Exception as e:
-                        logger.warning(f"  OCR failed for {img_file.name}: {e}")
-                        ocr_texts.append("")  # Empty text for failed pages
-                
-                # Step 3: Create searchable PDF
-                logger.info("  Creating searchable PDF...")
-                self.create_searchable_pdf_from_images_and_text(
-                    image_files, ocr_texts, output_path
-                )
-                
-                return True
-                
+            return self.ocr_pdf_with_pymupdf(input_path, output_path)
+        except ImportError:
+            logger.info("  PyMuPDF not available")
+        except Exception as e:
+            logger.info(f"  PyMuPDF OCR failed, falling back to separate images: {e}")
+        
+        try:
+            try:
+                import pikepdf
+            except ImportError:
+                pikepdf = None
+            
+            # One tesseract run per batch instead of per page, batches spread over the pool
+            page_count = self.page_count(input_path) or OCR_BATCH_SIZE * self.page_workers
+            batch_size = max(1, min(OCR_BATCH_SIZE, -(-page_count // self.page_workers)))
+            
+            # Pages stream through render -> OCR -> output, so only the pages in flight
+            # are held in memory rather than the whole document
+            logger.info("  Running OCR on images...")
+            if pikepdf is not None:
+                # Tesseract writes the image with word-positioned invisible text
+                results = self.ocr_page_stream(self.render_pages(input_path), _ocr_batch_to_pdf, batch_size)
+                if self.combine_page_pdfs((pdf for _, pdfs in results for pdf in pdfs), output_path):
+                    return True
+                logger.info("  Some pages failed, rebuilding with reportlab...")
+            
+            results = self.ocr_page_stream(self.render_pages(input_path), _ocr_batch_text, batch_size)
+            return self.create_searchable_pdf_from_images_and_text(
+                (page for batch, texts in results for page in zip(batch, texts)), output_path
+            )
+            
         except Exception as e:
             logger.error(f"  PDF to images OCR failed: {e}")
             return False
     
-    def create_searchable_pdf_from_images_and_text(self, image_files, ocr_texts, output_path):
-        """Create a searchable PDF from images and OCR text"""
+    def combine_page_pdfs(self, page_pdfs, output_path):
+        """Join the PDFs tesseract wrote for each page or batch into the output file"""
+        import pikepdf
+        
+        with ExitStack() as stack:
+            pdf = stack.enter_context(pikepdf.Pdf.new())
+            for page_pdf in page_pdfs:
+                if page_pdf is None:
+                    return False  # A page failed OCR; nothing has been written yet
+                # Sources must stay open until the combined PDF is saved
+                src = stack.enter_context(pikepdf.Pdf.open(io.BytesIO(page_pdf)))
+                pdf.pages.extend(src.pages)
+            logger.info("  Creating searchable PDF...")
+            pdf.save(output_path)
+        
+        logger.info("  ✅ Searchable PDF created successfully")
+        return True
+    
+    def create_searchable_pdf_from_images_and_text(self, pages, output_path):
+        """Create a searchable PDF from (image, OCR text) pairs"""
         try:
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter
@@ -316,12 +543,12 @@ class FixedBatchPDFOCR:
             c = canvas.Canvas(str(output_path), pagesize=letter)
             page_width, page_height = letter
             
-            for i, (img_file, text) in enumerate(zip(image_files, ocr_texts)):
-                logger.info(f"    Processing page {i+1}/{len(image_files)}")
+            for page_num, (img_file, text) in enumerate(pages, 1):
+                logger.info(f"    Processing page {page_num}")
                 
                 try:
                     # Add image to page
-                    with Image.open(img_file) as img:
+                    with _page_image(img_file) as img:
                         # Convert to RGB if necessary
                         if img.mode != 'RGB':
                             img = img.convert('RGB')
@@ -339,8 +566,13 @@ class FixedBatchPDFOCR:
                         x = (page_width - final_width) / 2
                         y = (page_height - final_height) / 2
                         
+                        # Scans don't need lossless page images; JPEG keeps the PDF small
+                        jpeg = io.BytesIO()
+                        img.save(jpeg, 'JPEG', quality=80, optimize=True)
+                        jpeg.seek(0)
+                        
                         # Draw image
-                        c.drawImage(ImageReader(img), x, y, final_width, final_height)
+                        c.drawImage(ImageReader(jpeg), x, y, final_width, final_height)
                         
                         # Add invisible text layer for searchability
                         if text.strip():
@@ -364,12 +596,11 @@ class FixedBatchPDFOCR:
                             # Reset alpha for next page
                             c.setFillAlpha(1.0)
                         
-                        # Add page break except for last page
-                        if i < len(image_files) - 1:
-                            c.showPage()
+                        # End the page; save() adds no blank page after the last one
+                        c.showPage()
                             
                 except Exception as e:
-                    logger.warning(f"    Error processing page {i+1}: {e}")
+                    logger.warning(f"    Error processing page {page_num}: {e}")
                     continue
             
             c.save()
@@ -380,21 +611,54 @@ class FixedBatchPDFOCR:
             logger.error(f"  Failed to create searchable PDF: {e}")
             return False
     
+    def file_hash(self, pdf_path):
+        """Hash a PDF's bytes for the OCR cache"""
+        digest = content_hash()
+        with open(pdf_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def cache_key(self, pdf_path, method):
+        """Cache key for a PDF: its hash plus everything that changes the OCR output"""
+        options = [name for name in ('deskew', 'rotate_pages', 'clean') if getattr(self, name)]
+        settings_tag = '-'.join([f"v{OCR_CACHE_VERSION}", method] + options)
+        return f"{self.file_hash(pdf_path)}-{settings_tag}"
+    
+    def store_in_cache(self, cache_key, pdf_path, output_path):
+        """Keep a copy of an OCR result and note its source next to it"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so other workers never see a partial file
+            cached_path = self.cache_dir / f"{cache_key}.pdf"
+            temp_path = self.cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+            shutil.copy(output_path, temp_path)
+            os.replace(temp_path, cached_path)
+            # One small file per entry, so concurrent workers never clobber each other's entries
+            (self.cache_dir / f"{cache_key}.src").write_text(str(pdf_path), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"  Could not cache OCR result for {pdf_path.name}: {e}")
+    
     def process_single_pdf(self, pdf_path, method='auto'):
-        """Process a single PDF file"""
+        """Process a single PDF file; returns 'processed', 'already_ocr' or 'failed'"""
+        # The caller counts the result, so workers in other processes need no shared stats
         logger.info(f"Processing: {pdf_path.name}")
         
-        # Check if already has text
-        if self.check_if_pdf_has_text(pdf_path):
+        # ocrmypdf skips text pages itself; only the image fallback needs the pre-scan
+        if method == 'pdf2images' and self.check_if_pdf_has_text(pdf_path):
             logger.info(f"  ✅ Already contains searchable text - skipping")
-            self.stats['already_ocr'] += 1
-            return True
+            return 'already_ocr'
         
         # Create backup if requested
         if self.backup_originals:
             backup_path = pdf_path.with_suffix('.pdf.backup')
             if not backup_path.exists():
-                shutil.copy2(pdf_path, backup_path)
+                # The original is never written in place, so a hardlink preserves it
+                # without copying; fall back to a copy across devices or on FAT
+                try:
+                    os.link(pdf_path, backup_path)
+                except OSError:
+                    shutil.copy2(pdf_path, backup_path)
                 logger.info(f"  📄 Created backup: {backup_path.name}")
         
         # Create output path
@@ -407,20 +671,36 @@ class FixedBatchPDFOCR:
         # Try different OCR methods
         success = False
         
-        if method in ['auto', 'ocrmypdf']:
+        cache_key = None
+        if self.cache_dir:
+            cache_key = self.cache_key(pdf_path, method)
+            cached_path = self.cache_dir / f"{cache_key}.pdf"
+            if cached_path.exists():
+                shutil.copy(cached_path, output_path)
+                logger.info(f"  ♻️ Using cached OCR result")
+                success = True
+        
+        if not success and method in ['auto', 'ocrmypdf']:
             logger.info("  🔍 Trying ocrmypdf...")
             result = self.ocr_pdf_with_ocrmypdf_fixed(pdf_path, output_path)
             if result == "already_ocr":
-                self.stats['already_ocr'] += 1
-                return True
+                return 'already_ocr'
             elif result:
                 success = True
         
+        if not success and method == 'auto' and self.check_if_pdf_has_text(pdf_path):
+            # Rasterizing would throw away the existing text layer
+            logger.info(f"  ✅ Already contains searchable text - skipping")
+            return 'already_ocr'
+        
         if not success and method in ['auto', 'pdf2images']:
             logger.info("  🔍 Trying PDF to images + OCR...")
             success = self.pdf_to_images_and_ocr(pdf_path, output_path)
         
         if success:
+            if cache_key and not (self.cache_dir / f"{cache_key}.pdf").exists():
+                self.store_in_cache(cache_key, pdf_path, output_path)
+            
             # If we're replacing the original, do the replacement
             if not self.output_suffix:
                 original_temp = pdf_path.with_name(f"original_{pdf_path.name}")
@@ -429,12 +709,10 @@ class FixedBatchPDFOCR:
                 original_temp.unlink()  # Remove temp file
             
             logger.info(f"  ✅ OCR completed: {output_path.name}")
-            self.stats['processed'] += 1
-            return True
+            return 'processed'
         else:
             logger.error(f"  ❌ OCR failed for {pdf_path.name}")
-            self.stats['failed'] += 1
-            return False
+            return 'failed'
     
     def process_all_pdfs(self, method='auto', parallel=False):
         """Process all PDFs in the directory"""
@@ -448,6 +726,7 @@ class FixedBatchPDFOCR:
         logger.info(f"OCR method: {method}")
         logger.info(f"Parallel processing: {parallel}")
         logger.info(f"Max workers: {self.max_workers if parallel else 1}")
+        logger.info(f"Tesseract threads: {self.tess_threads or 'auto'}")
         logger.info("-" * 60)
         
         start_time = time.time()
@@ -479,7 +758,7 @@ class FixedBatchPDFOCR:
         for i, pdf_path in enumerate(pdf_files, 1):
             logger.info(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_path.relative_to(self.base_folder)}")
             try:
-                self.process_single_pdf(pdf_path, method)
+                self.stats[self.process_single_pdf(pdf_path, method)] += 1
             except KeyboardInterrupt:
                 logger.info("Process interrupted by user")
                 break
@@ -488,19 +767,31 @@ class FixedBatchPDFOCR:
                 self.stats['failed'] += 1
     
     def process_parallel(self, pdf_files, method):
-        """Process PDFs in parallel"""
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        """Process PDFs in parallel worker processes"""
+        # Split the cores between file processes and each file's page OCR processes
+        processes = min(self.max_workers, len(pdf_files))
+        page_workers = max(1, (os.cpu_count() or 1) // processes)
+        # Several files in flight would each start an OpenMP pool the size of the machine
+        tess_threads = self.tess_threads or page_workers
+        settings = dict(base_folder=self.base_folder, output_suffix=self.output_suffix,
+                        backup_originals=self.backup_originals, max_workers=1,
+                        page_workers=page_workers, cache_dir=self.cache_dir,
+                        tess_threads=tess_threads, deskew=self.deskew,
+                        rotate_pages=self.rotate_pages, clean=self.clean)
+        
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_file_worker,
+                                 initargs=(tess_threads,)) as executor:
             # Submit all tasks
             future_to_pdf = {
-                executor.submit(self.process_single_pdf, pdf_path, method): pdf_path 
+                executor.submit(_process_pdf_worker, settings, pdf_path, method): pdf_path 
                 for pdf_path in pdf_files
             }
             
-            # Process completed tasks
+            # Process completed tasks; only this process touches the stats
             for i, future in enumerate(as_completed(future_to_pdf), 1):
                 pdf_path = future_to_pdf[future]
                 try:
-                    future.result()
+                    self.stats[future.result()] += 1
                     logger.info(f"[{i}/{len(pdf_files)}] Completed: {pdf_path.name}")
                 except Exception as e:
                     logger.error(f"Error processing {pdf_path.name}: {e}")
@@ -516,11 +807,15 @@ def check_dependencies():
     
     # Check core requirements
     try:
-        import PyPDF2
-        print("✅ PyPDF2 - Available")
+        import pypdf
+        print("✅ pypdf - Available")
     except ImportError:
-        print("❌ PyPDF2 - Missing")
-        missing_packages.append("PyPDF2")
+        try:
+            import PyPDF2
+            print("✅ PyPDF2 - Available (pypdf is its faster, maintained successor)")
+        except ImportError:
+            print("❌ pypdf - Missing")
+            missing_packages.append("pypdf")
     
     try:
         import pytesseract
@@ -572,6 +867,13 @@ def check_dependencies():
         print("⚠️  PyMuPDF - Missing (alternative)")
         print("   Install with: pip install PyMuPDF")
     
+    try:
+        import pikepdf
+        print("✅ pikepdf - Available")
+    except ImportError:
+        print("⚠️  pikepdf - Missing (positioned text layer for the image fallback)")
+        print("   Install with: pip install pikepdf")
+    
     print("-" * 40)
     
     if missing_packages:
@@ -580,7 +882,7 @@ def check_dependencies():
             print(f"   - {package}")
         print(f"\nInstall with: pip install {' '.join(missing_packages)}")
         print("\nOptional but recommended:")
-        print("   pip install ocrmypdf pdf2image PyMuPDF")
+        print("   pip install ocrmypdf pdf2image PyMuPDF pikepdf")
         return False
     
     if available_methods:
@@ -609,7 +911,17 @@ def main():
     parser.add_argument('--parallel', action='store_true',
                         help='Process files in parallel')
     parser.add_argument('--max-workers', type=int, default=2,
-                        help='Maximum parallel workers (default: 2)')
+                        help='Maximum parallel worker processes (default: 2)')
+    parser.add_argument('--deskew', action='store_true',
+                        help='Straighten skewed pages before OCR (ocrmypdf)')
+    parser.add_argument('--rotate-pages', action='store_true',
+                        help='Detect and fix page orientation before OCR (ocrmypdf)')
+    parser.add_argument('--clean', action='store_true',
+                        help='Clean up page images with unpaper before OCR (ocrmypdf)')
+    parser.add_argument('--tess-threads', type=int,
+                        help='OpenMP threads per tesseract (default: all cores, or cores / max workers with --parallel)')
+    parser.add_argument('--cache-dir', default='.ocr_cache',
+                        help='Folder for cached OCR results (use empty string to disable)')
     parser.add_argument('--check-deps', action='store_true',
                         help='Check dependencies and exit')
     
@@ -634,6 +946,7 @@ def main():
     print(f"Method: {args.method}")
     print(f"Output suffix: '{args.output_suffix}'")
     print(f"Create backups: {not args.no_backup}")
+    print(f"OCR cache: {args.cache_dir or 'disabled'}")
     print(f"Parallel processing: {args.parallel}")
     if args.parallel:
         print(f"Max workers: {args.max_workers}")
@@ -644,7 +957,12 @@ def main():
         args.folder_path,
         output_suffix=args.output_suffix if args.output_suffix else "",
         backup_originals=not args.no_backup,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        cache_dir=args.cache_dir,
+        tess_threads=args.tess_threads,
+        deskew=args.deskew,
+        rotate_pages=args.rotate_pages,
+        clean=args.clean
     )
     
     try:
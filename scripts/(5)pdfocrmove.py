@@ -1,20 +1,44 @@
 import os
 import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-def move_non_ocr_pdfs(root_path, destination_folder):
+def _move_one(source_path, destination_path, verbose):
+    # Same filesystem: a rename only touches directory entries
+    try:
+        os.rename(source_path, destination_path)
+    except OSError:
+        # Other drive (or an existing target on Windows): let shutil copy and delete
+        shutil.move(source_path, destination_path)
+    if verbose:
+        print(f"Moved: {source_path} -> {destination_path}")
+
+def move_non_ocr_pdfs(root_path, destination_folder, verbose=False):
     os.makedirs(destination_folder, exist_ok=True)
-    for dirpath, _, filenames in os.walk(root_path):
-        for filename in filenames:
-            if filename.lower().endswith(".pdf") and "_ocr" not in filename.lower():
-                source_path = Path(dirpath) / filename
-                destination_path = Path(destination_folder) / filename
-                shutil.move(source_path, destination_path)
-                print(f"Moved: {source_path} -> {destination_path}")
+    destination = os.path.abspath(destination_folder)
+    moved = 0
+    # Cross-drive moves are copies, so run them in threads while the walk continues
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = []
+        pending = [root_path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if name.endswith(".pdf") and "_ocr" not in name and entry.is_file():
+                        destination_path = os.path.join(destination_folder, entry.name)
+                        futures.append(executor.submit(_move_one, entry.path, destination_path, verbose))
+                    elif entry.is_dir(follow_symlinks=False) and os.path.abspath(entry.path) != destination:
+                        pending.append(entry.path)
+        for future in futures:
+            future.result()
+            moved += 1
+    print(f"Moved {moved} PDFs to {destination_folder}")
 
 # -------- USER CONFIGURATION --------
 root_directory = Path("/path/to/search/root")
 destination_directory = Path("/path/to/destination")
+verbose = False  # Print every file as it is moved
 # -------------------------------------
 
-move_non_ocr_pdfs(root_directory, destination_directory)
+move_non_ocr_pdfs(root_directory, destination_directory, verbose)
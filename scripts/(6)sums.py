@@ -1,5 +1,9 @@
 import os
 import csv
+import json
+import argparse
+import hashlib
+import tempfile
 import fitz  # PyMuPDF
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +12,22 @@ from dotenv import load_dotenv
 import re
 import time
 import logging
+import asyncio
+from aiolimiter import AsyncLimiter
+from concurrent.futures import ProcessPoolExecutor
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# h2 lets httpx speak HTTP/2, multiplexing concurrent requests over one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,11 +36,19 @@ logger = logging.getLogger(__name__)
 # Load API key from .env file
 load_dotenv()
 
+# Idle connections are kept open this long, so requests don't repeat the TLS handshake
+KEEPALIVE_SECONDS = 60.0
+
 # Set up OpenAI client (updated for newer versions)
 try:
     # For newer openai library versions (1.0+)
-    from openai import OpenAI
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    from openai import OpenAI, AsyncOpenAI, DEFAULT_TIMEOUT
+    import httpx
+    client = OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=httpx.Client(http2=HTTP2_AVAILABLE, timeout=DEFAULT_TIMEOUT,
+                                 limits=httpx.Limits(keepalive_expiry=KEEPALIVE_SECONDS))
+    )
     USE_NEW_API = True
 except ImportError:
     # For older openai library versions
@@ -28,56 +56,167 @@ except ImportError:
     openai.api_key = os.getenv("OPENAI_API_KEY")
     USE_NEW_API = False
 
+# Errors worth retrying with backoff (names cover both the 1.x and legacy clients)
+RETRYABLE_ERRORS = ('RateLimitError', 'APITimeoutError', 'Timeout', 'APIConnectionError', 'ServiceUnavailableError')
+
+# Meetings this short are packed several to a request instead of one call each
+SHORT_MEETING_TOKENS = 3000
+BATCH_TOKEN_LIMIT = 11000  # Meeting text per request, well inside gpt-4o-mini's 128k context
+BATCH_MAX_MEETINGS = 6
+BATCH_REPLY_TOKENS = 2000  # Same reply budget as a single call; 6 x 2000 fits the 16k output limit
+
+# Precompiled patterns for text cleanup, date detection and response parsing
+EXTRA_WHITESPACE = re.compile(r'\n\s*\n\s*\n|[ \t]+')  # Runs of blank lines, or of spaces/tabs
+OCR_ARTIFACTS = re.compile(r'[^\w\s\.,;:!?\-\(\)\[\]"\'/\$%&@#]')
+# ASCII artifacts are blanked with str.translate; the regex only has to run on non-ASCII text
+ASCII_ARTIFACTS = str.maketrans({chr(c): ' ' for c in range(128) if OCR_ARTIFACTS.match(chr(c))})
+# Common OCR mistakes in meeting minutes, fixed as whole space-separated words in one pass
+OCR_FIXES = {
+    'tho': 'the',
+    'ard': 'and',
+    'mado': 'made',
+    'soconded': 'seconded',
+    'moeting': 'meeting',
+    'minutos': 'minutes',
+}
+OCR_FIX_PATTERN = re.compile(r'(?<= )(' + '|'.join(OCR_FIXES) + r')(?= )')
+FILENAME_DATE_PATTERNS = [
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),  # YYYY-MM-DD format
+    re.compile(r'(\d{4}_\d{2}_\d{2})'),  # YYYY_MM_DD format
+]
+FOLDER_DATE_PATTERNS = [
+    re.compile(r'^(\d{4}-\d{2}-\d{2})$'),  # Exact YYYY-MM-DD format
+]
+SYNOPSIS_HEADER = re.compile(r'^\*?\*?synopsis\*?\*?:?\s*', re.IGNORECASE)
+SUMMARY_HEADER = re.compile(r'^\*?\*?summary\*?\*?:?\s*', re.IGNORECASE)
+KEY_NOTES_HEADER = re.compile(r'^\*?\*?key notes?\*?\*?:?\s*', re.IGNORECASE)
+
+CSV_FIELDS = ["Date", "PDF_File", "Synopsis", "Summary", "Key Notes"]
+
+def is_retryable(error):
+    return type(error).__name__ in RETRYABLE_ERRORS
+
+def count_tokens(text):
+    """Prompt size in tokens (rough 4 chars/token estimate without tiktoken)"""
+    if tiktoken is None:
+        return len(text) // 4
+    return len(tiktoken.get_encoding("cl100k_base").encode(text))
+
+def extract_text_from_pdf(pdf_path, max_chars=None):
+    """Extract and clean the text of a PDF with PyMuPDF (module-level so worker processes can run it)"""
+    try:
+        parts = []
+        running_len = 0
+        with fitz.open(pdf_path) as doc:
+            for page_num in range(doc.page_count):
+                page_text = doc[page_num].get_text()
+                if not page_text.strip():  # Only add non-empty pages
+                    continue
+                part = clean_text(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
+                running_len += len(part) + (2 if parts else 0)  # Joined with blank lines
+                parts.append(part)
+                # Text past max_chars is truncated anyway, so don't decode the remaining pages
+                if max_chars and running_len > max_chars:
+                    break
+        
+        return "\n\n".join(parts)
+        
+    except Exception as e:
+        logger.error(f"Error extracting text from {pdf_path}: {e}")
+        return ""
+
+def clean_text(text):
+    """Clean and normalize extracted text"""
+    # Remove excessive whitespace (blank-line runs and space runs in one pass)
+    text = EXTRA_WHITESPACE.sub(lambda m: '\n\n' if m.group(0)[0] == '\n' else ' ', text)
+    
+    # Remove common OCR artifacts
+    text = text.translate(ASCII_ARTIFACTS)
+    if not text.isascii():
+        text = OCR_ARTIFACTS.sub(' ', text)
+    
+    # Fix common OCR mistakes in meeting minutes
+    text = OCR_FIX_PATTERN.sub(lambda m: OCR_FIXES[m.group(0)], text)
+    
+    return text.strip()
+
 class MeetingMinutesSummarizer:
-    def __init__(self, root_dir, output_csv, max_chars=20000):
+    def __init__(self, root_dir, output_csv, max_chars=20000, max_concurrent=100,
+                 requests_per_minute=60, tokens_per_minute=160000, realtime=False, poll_interval=60,
+                 extract_workers=None):
         self.root_dir = Path(root_dir)
         self.output_csv = Path(output_csv)
         self.max_chars = max_chars  # Limit for API calls (reduced for token limits)
+        self.max_concurrent = max_concurrent  # OpenAI requests in flight at once
+        self.extract_workers = extract_workers or os.cpu_count()  # Processes for PyMuPDF text extraction
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = 5
+        self.realtime = realtime  # Live requests instead of the (half-price, up to 24h) Batch API
+        self.poll_interval = poll_interval  # Seconds between Batch API status checks
+        
+        # Summaries cached by PDF content hash; bump prompt_version whenever a prompt changes
+        self.cache_dir = self.output_csv.parent / ".summary_cache"
+        # Dates already written to the CSV by an interrupted run (removed once a run completes)
+        self.progress_file = self.output_csv.parent / "processed_dates.txt"
+        self.prompt_version = "v2"
+        self.model = "gpt-4o-mini"  # Single-meeting summaries (JSON mode)
+        self.batch_model = "gpt-4o-mini"  # Packed short meetings (JSON mode)
         
         # Statistics
         self.stats = {
             'total_found': 0,
             'processed': 0,
             'failed': 0,
-            'skipped': 0
+            'skipped': 0,
+            'cached': 0
         }
     
     def find_pdf_files(self):
         """Find all PDF files, prioritizing OCR versions"""
         pdf_files = {}
         
-        # Walk through all directories
-        for pdf_file in self.root_dir.rglob("*.pdf"):
-            # Skip backup files
-            if pdf_file.name.endswith('.backup') or 'backup' in pdf_file.name.lower():
-                continue
-            
-            # Extract date from filename or parent folder
-            date_key = self.extract_date_key(pdf_file)
-            if not date_key:
-                continue
-            
-            # Prioritize OCR versions
-            if date_key not in pdf_files:
-                pdf_files[date_key] = pdf_file
-            elif '_ocr' in pdf_file.name and '_ocr' not in pdf_files[date_key].name:
-                # Replace with OCR version if available
-                pdf_files[date_key] = pdf_file
-                logger.info(f"Using OCR version: {pdf_file.name}")
+        # One scandir pass per folder: DirEntry caches the file type, so only
+        # PDFs are looked at and backup folders are never descended into
+        pending = [str(self.root_dir)]
+        while pending:
+            folder = pending.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir():
+                            if 'backup' not in name.lower():
+                                pending.append(entry.path)
+                            continue
+                        
+                        # Skip backup files
+                        if not name.endswith('.pdf') or 'backup' in name.lower() or not entry.is_file():
+                            continue
+                        
+                        # Extract date from filename or parent folder
+                        date_key = self.extract_date_key(name, os.path.basename(folder))
+                        if not date_key:
+                            continue
+                        
+                        # Prioritize OCR versions
+                        if date_key not in pdf_files:
+                            pdf_files[date_key] = entry.path
+                        elif '_ocr' in name and '_ocr' not in os.path.basename(pdf_files[date_key]):
+                            # Replace with OCR version if available
+                            pdf_files[date_key] = entry.path
+                            logger.info(f"Using OCR version: {name}")
+            except OSError as e:
+                logger.warning(f"Could not list {folder}: {e}")
         
         self.stats['total_found'] = len(pdf_files)
-        return pdf_files
+        return {date_key: Path(path) for date_key, path in pdf_files.items()}
     
-    def extract_date_key(self, pdf_file):
+    def extract_date_key(self, file_name, folder_name):
         """Extract date key from filename or folder name"""
         # Try filename first (e.g., "1970-01-05_meeting_minutes_ocr.pdf")
-        filename_patterns = [
-            r'(\d{4}-\d{2}-\d{2})',  # YYYY-MM-DD format
-            r'(\d{4}_\d{2}_\d{2})',  # YYYY_MM_DD format
-        ]
-        
-        for pattern in filename_patterns:
-            match = re.search(pattern, pdf_file.name)
+        for pattern in FILENAME_DATE_PATTERNS:
+            match = pattern.search(file_name)
             if match:
                 date_str = match.group(1).replace('_', '-')
                 try:
@@ -87,12 +226,8 @@ class MeetingMinutesSummarizer:
                     continue
         
         # Try parent folder name (e.g., "1970-01-05" folder)
-        parent_patterns = [
-            r'^(\d{4}-\d{2}-\d{2})$',  # Exact YYYY-MM-DD format
-        ]
-        
-        for pattern in parent_patterns:
-            match = re.match(pattern, pdf_file.parent.name)
+        for pattern in FOLDER_DATE_PATTERNS:
+            match = pattern.match(folder_name)
             if match:
                 date_str = match.group(1)
                 try:
@@ -103,65 +238,8 @@ class MeetingMinutesSummarizer:
         
         return None
     
-    def extract_text_from_pdf(self, pdf_path):
-        """Extract text from PDF using PyMuPDF"""
-        try:
-            text = ""
-            with fitz.open(pdf_path) as doc:
-                for page_num, page in enumerate(doc):
-                    page_text = page.get_text()
-                    if page_text.strip():  # Only add non-empty pages
-                        text += f"\n--- Page {page_num + 1} ---\n"
-                        text += page_text
-                        text += "\n"
-            
-            # Clean up the text
-            text = self.clean_text(text)
-            
-            # Truncate if too long
-            if len(text) > self.max_chars:
-                logger.warning(f"Text truncated from {len(text)} to {self.max_chars} characters")
-                text = text[:self.max_chars] + "\n\n[TEXT TRUNCATED DUE TO LENGTH]"
-            
-            return text
-            
-        except Exception as e:
-            logger.error(f"Error extracting text from {pdf_path}: {e}")
-            return ""
-    
-    def clean_text(self, text):
-        """Clean and normalize extracted text"""
-        # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        
-        # Remove common OCR artifacts
-        text = re.sub(r'[^\w\s\.,;:!?\-\(\)\[\]"\'/\$%&@#]', ' ', text)
-        
-        # Fix common OCR mistakes in meeting minutes
-        replacements = {
-            ' tho ': ' the ',
-            ' ard ': ' and ',
-            ' mado ': ' made ',
-            ' soconded ': ' seconded ',
-            ' moeting ': ' meeting ',
-            ' minutos ': ' minutes ',
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text.strip()
-    
-    def generate_summary(self, text, date_str):
-        """Generate structured summary using OpenAI"""
-        if not text.strip():
-            return {
-                "synopsis": "No readable text found in PDF",
-                "summary": "Unable to extract text content",
-                "key_notes": "N/A"
-            }
-        
+    def summary_prompt(self, text, date_str):
+        """Build the single-meeting summary prompt"""
         # Additional truncation for very long texts to ensure we fit in token limits
         # GPT-4 has ~8192 tokens, and we need space for the prompt too
         max_text_chars = 15000  # Conservative limit to leave room for prompt
@@ -172,10 +250,10 @@ class MeetingMinutesSummarizer:
         prompt = (
             "You are a professional historian and archivist specializing in Oklahoma City Board of Education meetings. "
             f"This is a meeting from {date_str}. "
-            "Using only the content provided below, generate a structured summary with the following sections:\n\n"
-            "1. **Synopsis:** An overview (3-7 sentences) of meeting's main theme, issues, context.\n"
-            "2. **Summary:** A detailed summary of discussions, decisions, actions taken, motions, legal and financial statements and reports, controversies, and notable processes.\n"
-            "3. **Key Notes:** List specific motions, resolutions, votes, personnel actions, financial matters, and significant issues discussed.\n\n"
+            "Using only the content provided below, return a JSON object with these keys:\n\n"
+            "- \"synopsis\": An overview (3-7 sentences) of meeting's main theme, issues, context.\n"
+            "- \"summary\": A detailed summary of discussions, decisions, actions taken, motions, legal and financial statements and reports, controversies, and notable processes.\n"
+            "- \"key_notes\": Specific motions, resolutions, votes, personnel actions, financial matters, and significant issues discussed.\n\n"
             "Important guidelines:\n"
             "- Use only information present in the text\n"
             "- Include specific names, amounts, and dates when mentioned\n"
@@ -185,26 +263,23 @@ class MeetingMinutesSummarizer:
             "- If text is unclear or incomplete, note this limitation\n\n"
             f"Meeting Minutes Text:\n{text}"
         )
+        return prompt
+    
+    async def generate_summary(self, text, date_str):
+        """Generate structured summary using OpenAI"""
+        if not text.strip():
+            return {
+                "synopsis": "No readable text found in PDF",
+                "summary": "Unable to extract text content",
+                "key_notes": "N/A",
+                "failed": True
+            }
+        
+        prompt = self.summary_prompt(text, date_str)
         
         try:
-            if USE_NEW_API:
-                # Use new OpenAI client with gpt-3.5-turbo (larger context window and cheaper)
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo-16k",  # 16k context window model
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=2000
-                )
-                content = response.choices[0].message.content
-            else:
-                # Use legacy OpenAI API
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo-16k",  # 16k context window model
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=2000
-                )
-                content = response['choices'][0]['message']['content']
+            # Use gpt-4o-mini (128k context, cheaper and faster than gpt-3.5-turbo-16k)
+            content = await self.chat_completion(self.model, prompt, max_tokens=2000, json_mode=True)
             
             # Parse the response into sections
             return self.parse_summary_response(content)
@@ -215,42 +290,28 @@ class MeetingMinutesSummarizer:
             # If we still hit token limits, try with even shorter text
             if "context_length_exceeded" in str(e) or "maximum context length" in str(e):
                 logger.info(f"  Retrying with shorter text...")
-                return self.generate_summary_short(text[:8000], date_str)  # Much shorter
+                return await self.generate_summary_short(text[:8000], date_str)  # Much shorter
             
             return {
                 "synopsis": f"Error generating summary: {str(e)}",
                 "summary": "Unable to process due to API error",
-                "key_notes": "N/A"
+                "key_notes": "N/A",
+                "failed": True
             }
     
-    def generate_summary_short(self, text, date_str):
+    async def generate_summary_short(self, text, date_str):
         """Generate summary with much shorter text for problematic documents"""
         prompt = (
             f"Summarize this Oklahoma City Board of Education meeting from {date_str}. "
-            "Provide:\n"
-            "1. **Synopsis:** Brief overview (1-2 sentences)\n"
-            "2. **Summary:** Key discussions and decisions\n"
-            "3. **Key Notes:** Important motions, votes, personnel changes, financial matters\n\n"
+            "Return a JSON object with these keys:\n"
+            "- \"synopsis\": Brief overview (1-2 sentences)\n"
+            "- \"summary\": Key discussions and decisions\n"
+            "- \"key_notes\": Important motions, votes, personnel changes, financial matters\n\n"
             f"Meeting text:\n{text}"
         )
         
         try:
-            if USE_NEW_API:
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",  # Standard model
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=1500
-                )
-                content = response.choices[0].message.content
-            else:
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=1500
-                )
-                content = response['choices'][0]['message']['content']
+            content = await self.chat_completion("gpt-3.5-turbo", prompt, max_tokens=1500, json_mode=True)  # Standard model
             
             return self.parse_summary_response(content)
             
@@ -259,11 +320,121 @@ class MeetingMinutesSummarizer:
             return {
                 "synopsis": f"Could not process - text too long: {str(e)}",
                 "summary": "Document too long for processing",
-                "key_notes": "Unable to extract due to length"
+                "key_notes": "Unable to extract due to length",
+                "failed": True
             }
     
+    def chat_request(self, model, prompt, max_tokens, json_mode=False):
+        """Chat completion request body, shared by live calls and Batch API lines"""
+        request = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.2,
+            "max_tokens": max_tokens
+        }
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+        return request
+    
+    async def chat_completion(self, model, prompt, max_tokens, json_mode=False):
+        """Send one chat request within the concurrency, RPM and TPM limits, backing off on rate/timeout errors"""
+        # Budget the prompt plus the largest possible reply against the token limit
+        tokens = min(count_tokens(prompt) + max_tokens, self.tokens_per_minute)
+        
+        request = self.chat_request(model, prompt, max_tokens, json_mode)
+        
+        async with self.semaphore:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception(is_retryable),
+                wait=wait_random_exponential(multiplier=1, max=60),
+                stop=stop_after_attempt(self.max_retries + 1),
+                reraise=True,
+            ):
+                with attempt:
+                    await self.request_limiter.acquire()
+                    await self.token_limiter.acquire(tokens)
+                    
+                    if USE_NEW_API:
+                        response = await self.async_client.chat.completions.create(**request)
+                        return response.choices[0].message.content
+                    else:
+                        # Use legacy OpenAI API
+                        response = await openai.ChatCompletion.acreate(**request)
+                        return response['choices'][0]['message']['content']
+    
+    def batch_prompt(self, items):
+        """Build the prompt asking for a JSON object of summaries keyed by meeting date"""
+        meetings = json.dumps([{"id": date_str, "text": text} for date_str, text in items], ensure_ascii=False)
+        prompt = (
+            "You are a professional historian and archivist specializing in Oklahoma City Board of Education meetings. "
+            "Below is a JSON list of meetings, each with an id (the meeting date) and its minutes text. "
+            "Using only each meeting's own text, return a JSON object mapping every id to an object with these keys:\n\n"
+            "- \"synopsis\": An overview (3-7 sentences) of meeting's main theme, issues, context.\n"
+            "- \"summary\": A detailed summary of discussions, decisions, actions taken, motions, legal and financial statements and reports, controversies, and notable processes.\n"
+            "- \"key_notes\": Specific motions, resolutions, votes, personnel actions, financial matters, and significant issues discussed.\n\n"
+            "Important guidelines:\n"
+            "- Use only information present in the text\n"
+            "- Include specific names, amounts, and dates when mentioned\n"
+            "- Note any votes and their outcomes\n"
+            "- Highlight personnel changes, appointments, or resignations\n"
+            "- Mention significant financial decisions or budget items\n"
+            "- If text is unclear or incomplete, note this limitation\n\n"
+            f"Meetings:\n{meetings}"
+        )
+        return prompt
+    
+    def parse_batch_response(self, parsed, items):
+        """Pull each meeting's summary out of a parsed JSON reply, skipping any that are missing"""
+        results = {}
+        for date_str, _ in items:
+            entry = parsed.get(date_str) if isinstance(parsed, dict) else None
+            if isinstance(entry, dict):
+                results[date_str] = self.summary_from_json(entry)
+        return results
+    
+    def summary_from_json(self, entry):
+        """Normalize one meeting's JSON summary object into the CSV sections"""
+        summary = {}
+        for key in ("synopsis", "summary", "key_notes"):
+            value = entry.get(key, "")
+            if isinstance(value, list):
+                value = "; ".join(map(str, value))
+            summary[key] = str(value).strip() or f"No {key.replace('_', ' ')} provided"
+        return summary
+    
+    async def generate_summaries_batched(self, items):
+        """Summarize several short meetings in one request, falling back to one call each"""
+        if len(items) == 1:
+            date_str, text = items[0]
+            return {date_str: await self.generate_summary(text, date_str)}
+        
+        prompt = self.batch_prompt(items)
+        
+        try:
+            content = await self.chat_completion(
+                self.batch_model, prompt, max_tokens=BATCH_REPLY_TOKENS * len(items), json_mode=True
+            )
+            parsed = json.loads(content)
+        except Exception as e:
+            logger.warning(f"  Batch of {len(items)} meetings failed ({e}), summarizing individually")
+            parsed = {}
+        
+        results = self.parse_batch_response(parsed, items)
+        for date_str, text in items:
+            if date_str not in results:
+                results[date_str] = await self.generate_summary(text, date_str)
+        return results
+    
     def parse_summary_response(self, content):
         """Parse the AI response into structured sections"""
+        # Replies are JSON objects; fall back to the section headers for anything else
+        try:
+            parsed = json.loads(content)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return self.summary_from_json(parsed)
+        
         synopsis = ""
         summary = ""
         key_notes = ""
@@ -275,22 +446,22 @@ class MeetingMinutesSummarizer:
             line = line.strip()
             
             # Detect section headers
-            if re.match(r'^\*?\*?synopsis\*?\*?:?', line, re.IGNORECASE):
+            if match := SYNOPSIS_HEADER.match(line):
                 current_section = 'synopsis'
                 # Extract content after the header if on same line
-                synopsis_content = re.sub(r'^\*?\*?synopsis\*?\*?:?\s*', '', line, flags=re.IGNORECASE)
+                synopsis_content = line[match.end():]
                 if synopsis_content:
                     synopsis = synopsis_content
                 continue
-            elif re.match(r'^\*?\*?summary\*?\*?:?', line, re.IGNORECASE):
+            elif match := SUMMARY_HEADER.match(line):
                 current_section = 'summary'
-                summary_content = re.sub(r'^\*?\*?summary\*?\*?:?\s*', '', line, flags=re.IGNORECASE)
+                summary_content = line[match.end():]
                 if summary_content:
                     summary = summary_content
                 continue
-            elif re.match(r'^\*?\*?key notes?\*?\*?:?', line, re.IGNORECASE):
+            elif match := KEY_NOTES_HEADER.match(line):
                 current_section = 'key_notes'
-                notes_content = re.sub(r'^\*?\*?key notes?\*?\*?:?\s*', '', line, flags=re.IGNORECASE)
+                notes_content = line[match.end():]
                 if notes_content:
                     key_notes = notes_content
                 continue
@@ -326,50 +497,109 @@ class MeetingMinutesSummarizer:
         # Sort by date
         sorted_dates = sorted(pdf_files.keys())
         
-        rows = []
         start_time = time.time()
         
+        # Resume an interrupted run: skip meetings it already wrote to the CSV
+        done_dates = self.load_progress()
+        if done_dates:
+            logger.info(f"Resuming: {len(done_dates)} meetings already written to {self.output_csv.name}")
+        
+        # Extract text up front, then keep many API requests in flight at once
+        texts = {}
+        hashes = {}
+        cached_summaries = {}
+        pending = []
         for i, date_str in enumerate(sorted_dates, 1):
             pdf_path = pdf_files[date_str]
-            logger.info(f"[{i}/{len(pdf_files)}] Processing {date_str}: {pdf_path.name}")
             
-            try:
-                # Extract text
-                text = self.extract_text_from_pdf(pdf_path)
+            if date_str in done_dates:
+                self.stats['skipped'] += 1
+                continue
+            
+            # Unchanged PDFs reuse their cached summary: no extraction, no API call
+            hashes[date_str] = self.file_hash(pdf_path)
+            cached = self.load_cached_summary(hashes[date_str])
+            if cached:
+                logger.info(f"[{i}/{len(pdf_files)}] ♻️  Cached summary for {date_str}: {pdf_path.name}")
+                cached_summaries[date_str] = cached
+                self.stats['cached'] += 1
+            else:
+                pending.append(date_str)
+        
+        # Text extraction is CPU-bound, so spread the PDFs across processes. One task per PDF:
+        # each stops decoding once it has max_chars of text, so even long files are quick.
+        logger.info(f"Extracting text from {len(pending)} PDFs ({self.extract_workers} processes)...")
+        with ProcessPoolExecutor(max_workers=self.extract_workers) as executor:
+            extracted = executor.map(
+                extract_text_from_pdf,
+                [pdf_files[date_str] for date_str in pending],
+                [self.max_chars] * len(pending),
+                chunksize=4
+            )
+            for i, (date_str, text) in enumerate(zip(pending, extracted), 1):
+                pdf_path = pdf_files[date_str]
+                logger.info(f"[{i}/{len(pending)}] Extracted {date_str}: {pdf_path.name}")
                 
                 if not text.strip():
                     logger.warning(f"No text extracted from {pdf_path.name}")
                     self.stats['failed'] += 1
                     continue
                 
+                # Truncate if too long
+                if len(text) > self.max_chars:
+                    logger.warning(f"Text truncated from {len(text)} to {self.max_chars} characters")
+                    text = text[:self.max_chars] + "\n\n[TEXT TRUNCATED DUE TO LENGTH]"
+                
                 logger.info(f"  Extracted {len(text)} characters of text")
+                texts[date_str] = text
+        
+        # Write each row as soon as its summary arrives, so an interrupted run loses nothing
+        self.output_csv.parent.mkdir(parents=True, exist_ok=True)
+        mode = "a" if done_dates else "w"
+        with open(self.output_csv, mode, newline="", encoding="utf-8") as csvfile, \
+             open(self.progress_file, mode, encoding="utf-8") as progress:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+            if not done_dates:
+                writer.writeheader()
+            
+            def record_summary(date_str, summary):
+                pdf_path = pdf_files[date_str]
                 
-                # Generate summary
-                logger.info("  Generating AI summary...")
-                summary = self.generate_summary(text, date_str)
+                if isinstance(summary, Exception):
+                    logger.error(f"  ❌ Error processing {pdf_path.name}: {summary}")
+                    self.stats['failed'] += 1
+                    return
                 
-                # Add to results
-                rows.append({
+                writer.writerow({
                     "Date": date_str,
                     "PDF_File": pdf_path.name,
                     "Synopsis": summary["synopsis"],
                     "Summary": summary["summary"],
                     "Key Notes": summary["key_notes"]
                 })
+                csvfile.flush()
+                progress.write(date_str + "\n")
+                progress.flush()
                 
                 self.stats['processed'] += 1
-                logger.info(f"  ✅ Successfully processed {date_str}")
-                
-                # Rate limiting - be nice to the API
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"  ❌ Error processing {pdf_path.name}: {e}")
-                self.stats['failed'] += 1
-                continue
+                if date_str in texts:
+                    if not summary.get("failed"):
+                        self.store_cached_summary(hashes[date_str], pdf_path, summary)
+                    logger.info(f"  ✅ Successfully processed {date_str}")
+            
+            for date_str, summary in cached_summaries.items():
+                record_summary(date_str, summary)
+            
+            if texts:
+                if self.realtime or not USE_NEW_API:
+                    logger.info(f"Generating AI summaries for {len(texts)} meetings (up to {self.max_concurrent} concurrent requests)...")
+                    asyncio.run(self._summarize_all(texts, record_summary))
+                else:
+                    self.summarize_with_batch_api(texts, record_summary)
         
-        # Write results to CSV
-        self.write_to_csv(rows)
+        # Run complete: rewrite the CSV in date order and drop the resume checkpoint
+        if self.sort_csv():
+            self.progress_file.unlink(missing_ok=True)
         
         # Print summary
         end_time = time.time()
@@ -379,30 +609,258 @@ class MeetingMinutesSummarizer:
         logger.info("PROCESSING COMPLETE")
         logger.info("=" * 60)
         logger.info(f"Total files found: {self.stats['total_found']}")
-        logger.info(f"Successfully processed: {self.stats['processed']}")
+        logger.info(f"Successfully processed: {self.stats['processed']} ({self.stats['cached']} from cache)")
         logger.info(f"Failed: {self.stats['failed']}")
+        if self.stats['skipped']:
+            logger.info(f"Already done in an earlier run: {self.stats['skipped']}")
         logger.info(f"Processing time: {duration:.1f} seconds")
         logger.info(f"Output file: {self.output_csv}")
     
+    def pack_meetings(self, texts):
+        """Group short meetings greedily into shared requests; long ones go alone"""
+        batches, batch, batch_tokens = [], [], 0
+        for date_str, text in texts.items():
+            tokens = count_tokens(text)
+            if tokens > SHORT_MEETING_TOKENS:
+                batches.append([(date_str, text)])
+                continue
+            if batch and (batch_tokens + tokens > BATCH_TOKEN_LIMIT or len(batch) == BATCH_MAX_MEETINGS):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append((date_str, text))
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    async def _summarize_all(self, texts, on_summary):
+        """Summarize every meeting on one event loop, sharing a single async client.
+        on_summary(date_str, summary_or_exception) is called as each request finishes."""
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        self.request_limiter = AsyncLimiter(self.requests_per_minute, 60)
+        self.token_limiter = AsyncLimiter(self.tokens_per_minute, 60)
+        if USE_NEW_API:
+            # One connection pool sized to the requests in flight, closed with the client below
+            http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.max_concurrent,
+                                    max_keepalive_connections=self.max_concurrent,
+                                    keepalive_expiry=KEEPALIVE_SECONDS)
+            )
+            self.async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+        
+        batches = self.pack_meetings(texts)
+        logger.info(f"Sending {len(texts)} meetings in {len(batches)} requests")
+        
+        async def summarize_batch(batch):
+            try:
+                return await self.generate_summaries_batched(batch)
+            except Exception as e:
+                return {date_str: e for date_str, _ in batch}
+        
+        try:
+            for finished in asyncio.as_completed([summarize_batch(batch) for batch in batches]):
+                for date_str, summary in (await finished).items():
+                    on_summary(date_str, summary)
+        finally:
+            if USE_NEW_API:
+                await self.async_client.close()
+    
+    def summarize_with_batch_api(self, texts, on_summary):
+        """Submit every summary request as one OpenAI Batch API job, wait for it, and pass each summary to on_summary"""
+        requests_file = self.output_csv.parent / "batch_requests.jsonl"
+        requests_file.parent.mkdir(parents=True, exist_ok=True)
+        # The id of a submitted job is kept here until its results are recorded, so an
+        # interrupted run picks the job back up instead of paying for it again
+        batch_id_file = requests_file.with_name("batch_id.txt")
+        
+        batch = self.resume_batch(batch_id_file)
+        resumed = batch is not None
+        if not resumed:
+            batches = self.pack_meetings(texts)
+            batch = self.submit_batch(batches, requests_file)
+            batch_id_file.write_text(batch.id, encoding="utf-8")
+            logger.info(f"📤 Submitted {len(texts)} meetings in {len(batches)} requests as batch {batch.id}")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(self.poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            done = f" ({counts.completed}/{counts.total} done)" if counts else ""
+            logger.info(f"  Batch {batch.id}: {batch.status}{done}")
+        
+        answered = set()
+        in_batch = set()
+        for output_file_id in (batch.output_file_id, batch.error_file_id):
+            if not output_file_id:
+                continue
+            for line in client.files.content(output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                in_batch.update(result["custom_id"].split(","))
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                # A resumed job may include meetings this run has already recorded
+                if not all(date_str in texts for date_str in result["custom_id"].split(",")):
+                    continue
+                items = [(date_str, texts[date_str]) for date_str in result["custom_id"].split(",")]
+                if len(items) == 1:
+                    summaries = {items[0][0]: self.parse_summary_response(content)}
+                else:
+                    try:
+                        summaries = self.parse_batch_response(json.loads(content), items)
+                    except ValueError:
+                        continue
+                for date_str, summary in summaries.items():
+                    on_summary(date_str, summary)
+                    answered.add(date_str)
+        
+        batch_id_file.unlink(missing_ok=True)
+        
+        if resumed:
+            # The earlier run's job only covered its own meetings; the rest get a job of their own
+            not_sent = {date_str: text for date_str, text in texts.items() if date_str not in in_batch}
+            if not_sent:
+                self.summarize_with_batch_api(not_sent, on_summary)
+                answered.update(not_sent)
+        
+        # Anything the batch didn't answer goes through the live path (with its own fallbacks)
+        missing = {date_str: text for date_str, text in texts.items() if date_str not in answered}
+        if missing:
+            logger.warning(f"Batch {batch.id} ended '{batch.status}' without {len(missing)} summaries, requesting them live")
+            asyncio.run(self._summarize_all(missing, on_summary))
+    
+    def submit_batch(self, batches, requests_file):
+        """Write the requests to requests_file and start a Batch API job on them"""
+        # Same requests as the live path; packed meetings share a custom_id of comma-joined dates
+        with open(requests_file, "w", encoding="utf-8") as f:
+            for items in batches:
+                if len(items) == 1:
+                    date_str, text = items[0]
+                    body = self.chat_request(self.model, self.summary_prompt(text, date_str), 2000, json_mode=True)
+                else:
+                    body = self.chat_request(self.batch_model, self.batch_prompt(items),
+                                             BATCH_REPLY_TOKENS * len(items), json_mode=True)
+                f.write(json.dumps({
+                    "custom_id": ",".join(date_str for date_str, _ in items),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }, ensure_ascii=False) + "\n")
+        
+        with open(requests_file, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+        return client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+    
+    def resume_batch(self, batch_id_file):
+        """The batch job an earlier run submitted, if it is still running or has finished"""
+        if not batch_id_file.exists():
+            return None
+        batch_id = batch_id_file.read_text(encoding="utf-8").strip()
+        try:
+            batch = client.batches.retrieve(batch_id)
+        except Exception as e:
+            logger.warning(f"Could not look up earlier batch {batch_id}, submitting a new one: {e}")
+            batch_id_file.unlink()
+            return None
+        if batch.status in ("failed", "expired", "cancelled"):
+            logger.warning(f"Earlier batch {batch_id} ended '{batch.status}', submitting a new one")
+            batch_id_file.unlink()
+            return None
+        logger.info(f"📥 Resuming batch {batch_id} ({batch.status}) from an earlier run")
+        return batch
+    
+    def file_hash(self, pdf_path):
+        """SHA-256 of the PDF contents, read in 64KB chunks"""
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def load_cached_summary(self, file_hash):
+        """Cached summary for this PDF, if it was made with the current prompt and model"""
+        cache_file = self.cache_dir / f"{file_hash}.json"
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("prompt_version") != self.prompt_version or entry.get("model") != self.model:
+            return None
+        return {key: entry[key] for key in ("synopsis", "summary", "key_notes")}
+    
+    def store_cached_summary(self, file_hash, pdf_path, summary):
+        """Write the cache entry atomically so an interrupted run never leaves a partial file"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = {
+                "prompt_version": self.prompt_version,
+                "model": self.model,
+                "pdf_file": pdf_path.name,
+                "synopsis": summary["synopsis"],
+                "summary": summary["summary"],
+                "key_notes": summary["key_notes"]
+            }
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.cache_dir,
+                                             suffix=".tmp", delete=False) as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(f.name, self.cache_dir / f"{file_hash}.json")
+        except Exception as e:
+            logger.warning(f"Could not cache summary for {pdf_path.name}: {e}")
+    
+    def load_progress(self):
+        """Dates an interrupted run already wrote (empty if there is nothing to resume)"""
+        if not (self.progress_file.exists() and self.output_csv.exists()):
+            return set()
+        with open(self.progress_file, encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+    
+    def sort_csv(self):
+        """Rewrite the streamed CSV in date order, keeping the last row written for each date"""
+        try:
+            with open(self.output_csv, newline="", encoding="utf-8") as csvfile:
+                rows = {row["Date"]: row for row in csv.DictReader(csvfile)}
+        except Exception as e:
+            logger.error(f"Error reading CSV file: {e}")
+            return False
+        return self.write_to_csv([rows[date_str] for date_str in sorted(rows)])
+    
     def write_to_csv(self, rows):
-        """Write results to CSV file"""
+        """Write results to CSV file (via a temp file, so the old file survives a failed write)"""
         try:
             # Create output directory if it doesn't exist
             self.output_csv.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.output_csv, mode="w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["Date", "PDF_File", "Synopsis", "Summary", "Key Notes"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            with tempfile.NamedTemporaryFile("w", newline="", encoding="utf-8", dir=self.output_csv.parent,
+                                             suffix=".tmp", delete=False) as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
                 writer.writeheader()
                 writer.writerows(rows)
+            os.replace(csvfile.name, self.output_csv)
             
             logger.info(f"✅ Results written to: {self.output_csv}")
             logger.info(f"📊 Total summaries: {len(rows)}")
+            return True
             
         except Exception as e:
             logger.error(f"Error writing CSV file: {e}")
+            return False
 
 def main():
+    parser = argparse.ArgumentParser(description="Summarize PDF meeting minutes with OpenAI")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Send live API requests instead of a Batch API job (faster, full price)")
+    args = parser.parse_args()
+    
     # Configuration
     input_folder = Path("/path/to/ocr_pdfs")
     output_file  = Path("/path/to/output/meeting_summaries.csv")
@@ -424,7 +882,7 @@ def main():
     logger.info("-" * 60)
     
     # Create and run summarizer
-    summarizer = MeetingMinutesSummarizer(input_folder, output_file)
+    summarizer = MeetingMinutesSummarizer(input_folder, output_file, realtime=args.realtime)
     
     try:
         summarizer.process_meeting_minutes()
@@ -434,8 +892,4 @@ def main():
         logger.error(f"Unexpected error: {e}")
 
 if __name__ == "__main__":
-    if not os.getenv("OPENAI_API_KEY"):
-        raise RuntimeError("OPENAI_API_KEY not found in environment variables")
-
-    summarizer = MeetingMinutesSummarizer(input_folder, output_file)
-    summarizer.process_meeting_minutes()
+    main()
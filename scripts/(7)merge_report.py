@@ -1,5 +1,13 @@
 import pandas as pd
 from pathlib import Path
+from collections import defaultdict
+
+# PyArrow's multithreaded CSV reader is much faster than pandas' default engine
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
 
 # -------- USER CONFIGURATION --------
 SUMMARIES_FILE = Path("/path/to/meeting_summaries.csv")   # e.g., "1973-2_meeting_summaries.csv"
@@ -7,22 +15,26 @@ ATTENDEES_FILE = Path("/path/to/attendees.csv")           # e.g., "1973_attendee
 OUTPUT_FILE    = Path("/path/to/output/merged.csv")       # e.g., "1973_merge.csv"
 # -------------------------------------
 
-# 1. Read the two sources
-summaries_df = pd.read_csv(SUMMARIES_FILE)
-compiled_df  = pd.read_csv(ATTENDEES_FILE)
+# 1. Read the two sources (summary dates are parsed by the reader itself)
+summaries_df = pd.read_csv(SUMMARIES_FILE, engine=CSV_ENGINE, parse_dates=["Date"])
+compiled_df  = pd.read_csv(ATTENDEES_FILE, engine=CSV_ENGINE)
 
-# 2. Ensure the Date columns are datetime
-summaries_df["Date"] = pd.to_datetime(summaries_df["Date"])
+# 2. Ensure the attendee Date column is datetime (hand-entered dates may not parse)
 compiled_df["Date"]  = pd.to_datetime(compiled_df["Date"], errors="coerce")
 
 # 3. Collapse attendees for each meeting
-attendees_grouped = (
-    compiled_df
-    .groupby("Date")
-    .apply(lambda x: x[["Category_1", "Category_2", "Name_1", "Name_2", "Title/Role"]]
-           .to_dict(orient="records"))
-    .reset_index(name="Attendees")
-)
+#    (one to_dict pass over all rows instead of a Python lambda per date group)
+attendee_columns = ["Category_1", "Category_2", "Name_1", "Name_2", "Title/Role"]
+attendees_by_date = defaultdict(list)
+for record in compiled_df[["Date"] + attendee_columns].to_dict(orient="records"):
+    date = record.pop("Date")
+    if pd.notna(date):  # groupby dropped rows whose date didn't parse
+        attendees_by_date[date].append(record)
+
+attendees_grouped = pd.DataFrame({
+    "Date": pd.to_datetime(list(attendees_by_date)),
+    "Attendees": list(attendees_by_date.values()),
+})
 
 # 4. Merge and save
 merged_df = pd.merge(summaries_df, attendees_grouped, on="Date", how="left")
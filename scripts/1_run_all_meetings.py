@@ -4,15 +4,27 @@
 
 import os
 import time
+import queue
+import threading
 import subprocess
 import openai
-import whisper
 import csv
+import wave
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pydub import AudioSegment
 from dotenv import load_dotenv
 import tiktoken
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+# faster-whisper (CTranslate2, int8/fp16 kernels) is several times faster than openai-whisper
+try:
+    from faster_whisper import WhisperModel
+    import ctranslate2
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    import whisper
+    FASTER_WHISPER_AVAILABLE = False
 
 # ---------- USER CONFIGURATION ------------------------------------------------
 # Edit these paths for your environment
@@ -40,11 +52,14 @@ if not openai.api_key:
     raise RuntimeError("OPENAI_API_KEY not found. Check your .env file.")
 
 # ---------- Helper Functions ---------------------------------------------------
+log_lock = threading.Lock()  # The pipeline stages log from separate threads
+
 def log(msg):
     now = time.strftime("%H:%M:%S")
-    with open(LOGFILE, "a", encoding="utf-8") as f:
-        f.write(f"{now} - {msg}\n")
-    print(f"{now} - {msg}")
+    with log_lock:
+        with open(LOGFILE, "a", encoding="utf-8") as f:
+            f.write(f"{now} - {msg}\n")
+        print(f"{now} - {msg}")
 
 def mp3_from_wav(wav: Path) -> Path:
     mp3 = MP3_DIR / (wav.stem + ".mp3")
@@ -64,49 +79,94 @@ def extract_date(name: str) -> str:
                 pass
     return "an unknown date"
 
+def wav_minutes(wav: Path, transcribed_seconds: float) -> float:
+    # Duration from the WAV header; no need to decode the whole file again
+    try:
+        with wave.open(str(wav), "rb") as w:
+            seconds = w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        # Formats the wave module can't read (e.g. float WAV): use the transcriber's duration
+        seconds = transcribed_seconds
+    return round(seconds / 60, 2)
+
+def transcribe(wav: Path):
+    """Return (transcript, audio duration in seconds)"""
+    if FASTER_WHISPER_AVAILABLE:
+        segments, info = whisper_model.transcribe(str(wav), beam_size=5, vad_filter=True)
+        return "".join(segment.text for segment in segments).strip(), info.duration
+    result = whisper_model.transcribe(str(wav))
+    segments = result.get("segments") or [{"end": 0}]
+    return result["text"], segments[-1]["end"]
+
 # ---------- Load Whisper -------------------------------------------------------
 log("Loading Whisper model… (first call is slow)")
-whisper_model = whisper.load_model("medium")
-
-enc = tiktoken.encoding_for_model("gpt-4")
+if FASTER_WHISPER_AVAILABLE:
+    if ctranslate2.get_cuda_device_count() > 0:
+        whisper_model = WhisperModel("medium", device="cuda", compute_type="int8_float16")
+    else:
+        whisper_model = WhisperModel("medium", device="cpu", compute_type="int8")
+else:
+    whisper_model = whisper.load_model("medium")
+
+enc = tiktoken.get_encoding("cl100k_base")  # GPT-4's encoding, loaded once for all meetings
 MAX_TOK = 3000  # chunk-size safety margin
+WINDOW_CHARS = 50_000  # Transcript text encoded per step in pieces()
+CHUNK_WORKERS = 8  # Chunk summaries requested at once per meeting
+
+# Errors worth retrying with backoff (names cover both the 1.x and legacy clients)
+RETRYABLE_ERRORS = ('RateLimitError', 'APITimeoutError', 'Timeout', 'APIConnectionError', 'ServiceUnavailableError')
+
+def pieces(text):
+    # Encode a window of text at a time (cut between words) rather than the whole
+    # transcript at once; leftover tokens carry over into the next chunk
+    tok = []
+    start = 0
+    while start < len(text):
+        end = start + WINDOW_CHARS
+        if end < len(text):
+            # A single space between two words is a token boundary either way
+            space = text.rfind(" ", start, end)
+            while space > start and (text[space - 1].isspace() or text[space + 1].isspace()):
+                space = text.rfind(" ", start, space)
+            if space > start:
+                end = space
+        tok.extend(enc.encode(text[start:end]))
+        start = end
+        while len(tok) >= MAX_TOK:
+            yield enc.decode(tok[:MAX_TOK])
+            del tok[:MAX_TOK]
+    if tok:
+        yield enc.decode(tok)
+
+@retry(
+    retry=retry_if_exception(lambda e: type(e).__name__ in RETRYABLE_ERRORS),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+def chat(**kwargs) -> str:
+    # Backs off and retries on rate limits/timeouts, which parallel chunk requests can hit
+    rsp = openai.ChatCompletion.create(**kwargs)
+    return rsp.choices[0].message.content.strip()
+
+def summarize_chunk(piece: str) -> str:
+    return chat(
+        model="gpt-4",
+        messages=[{
+            "role": "user",
+            "content": (
+                "Provide a concise summary of the following transcript "
+                "chunk so it can later be merged with other chunks.\n\n" + piece)
+        }],
+        temperature=0.3,
+    )
 
-# ---------- Main Processing Loop -----------------------------------------------
-log("\n=== Batch run started ===")
-for wav in WAV_DIR.glob("*.wav"):
-    name = wav.stem
-    mp3  = mp3_from_wav(wav)
-    txt  = TXT_DIR / f"{name}.txt"
-    summ = SUM_DIR / f"{name}.summary.txt"
-
-    # Transcription
-    log(f"Transcribing {wav.name}")
-    result = whisper_model.transcribe(str(wav))
-    transcript = result["text"]
-    txt.write_text(transcript, encoding="utf-8")
-
-    # Summarization
-    log(f"Summarizing {wav.name}")
-
-    def pieces(text):
-        tok = enc.encode(text)
-        for i in range(0, len(tok), MAX_TOK):
-            yield enc.decode(tok[i:i+MAX_TOK])
-
-    chunk_summaries = []
-    for n, piece in enumerate(pieces(transcript), 1):
-        log(f"  ↳ chunk {n}")
-        rsp = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[{
-                "role": "user",
-                "content": (
-                    "Provide a concise summary of the following transcript "
-                    "chunk so it can later be merged with other chunks.\n\n" + piece)
-            }],
-            temperature=0.3,
-        )
-        chunk_summaries.append(rsp.choices[0].message.content.strip())
+def summarize(wav: Path, transcript: str) -> str:
+    # Chunks are independent, so request them all at once; map keeps them in order
+    chunks = list(pieces(transcript))
+    log(f"  ↳ {wav.stem}: {len(chunks)} chunks")
+    with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+        chunk_summaries = list(executor.map(summarize_chunk, chunks))
 
     # Merge chunk summaries into a final summary
     merge_prompt = (
@@ -118,22 +178,19 @@ for wav in WAV_DIR.glob("*.wav"):
         "Structure the summary in a way that would be useful to researchers, historians, professors, and educators.\n\n"
         + "\n\n---\n\n".join(chunk_summaries)
     )
-    final_summary = openai.ChatCompletion.create(
+    return chat(
         model="gpt-4",
         messages=[{"role": "user", "content": merge_prompt}],
         temperature=0.2,
-    ).choices[0].message.content.strip()
-
-    summ.write_text(final_summary, encoding="utf-8")
-    log(f"Finished {wav.name}")
+    )
 
-    # Update index.csv
+def append_index(wav: Path, transcript: str, transcribed_seconds: float):
     index_path = BASE / "index.csv"
     header = ["file", "meeting_date", "duration_min", "word_count"]
     row = [
         wav.name,
-        extract_date(name),
-        round(AudioSegment.from_wav(wav).duration_seconds / 60, 2),
+        extract_date(wav.stem),
+        wav_minutes(wav, transcribed_seconds),
         len(transcript.split())
     ]
 
@@ -144,4 +201,54 @@ for wav in WAV_DIR.glob("*.wav"):
             writer.writerow(header)
         writer.writerow(row)
 
+# ---------- Pipeline Stages ----------------------------------------------------
+# ffmpeg (CPU), Whisper (GPU/CPU) and GPT-4 (network) run in their own threads,
+# so one meeting converts while another transcribes and a third is summarized.
+STOP = None
+transcribe_queue = queue.Queue(maxsize=3)  # Converted WAVs waiting for Whisper
+summarize_queue  = queue.Queue(maxsize=3)  # Transcripts waiting for GPT-4
+
+def converter():
+    for wav in WAV_DIR.glob("*.wav"):
+        try:
+            mp3_from_wav(wav)
+        except Exception as e:
+            log(f"❌ Converting {wav.name} failed, skipping: {e}")
+            continue
+        transcribe_queue.put(wav)
+    transcribe_queue.put(STOP)
+
+def transcriber():
+    while (wav := transcribe_queue.get()) is not STOP:
+        try:
+            log(f"Transcribing {wav.name}")
+            transcript, transcribed_seconds = transcribe(wav)
+            (TXT_DIR / f"{wav.stem}.txt").write_text(transcript, encoding="utf-8")
+        except Exception as e:
+            log(f"❌ Transcribing {wav.name} failed, skipping: {e}")
+            continue
+        summarize_queue.put((wav, transcript, transcribed_seconds))
+    summarize_queue.put(STOP)
+
+def summarizer():
+    # Only this thread writes summaries and index.csv, so rows never interleave
+    while (item := summarize_queue.get()) is not STOP:
+        wav, transcript, transcribed_seconds = item
+        try:
+            log(f"Summarizing {wav.name}")
+            final_summary = summarize(wav, transcript)
+            (SUM_DIR / f"{wav.stem}.summary.txt").write_text(final_summary, encoding="utf-8")
+            log(f"Finished {wav.name}")
+            append_index(wav, transcript, transcribed_seconds)
+        except Exception as e:
+            log(f"❌ Summarizing {wav.name} failed: {e}")
+
+# ---------- Main Processing Loop -----------------------------------------------
+log("\n=== Batch run started ===")
+stages = [threading.Thread(target=stage, name=stage.__name__) for stage in (converter, transcriber, summarizer)]
+for stage in stages:
+    stage.start()
+for stage in stages:
+    stage.join()
+
 log("=== Batch run complete ===\n")
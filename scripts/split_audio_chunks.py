@@ -2,11 +2,13 @@
 import os
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # -------- USER CONFIGURATION --------
 SOURCE_FOLDER = Path("/path/to/source_wavs")      # Folder containing input WAV files
 OUTPUT_FOLDER = Path("/path/to/output_chunks")    # Folder to save split WAVs
 CHUNK_SECONDS = 30 * 60  # Duration per chunk in seconds (30 minutes default)
+MAX_WORKERS   = min(os.cpu_count() or 1, 4)  # ffmpeg processes to run at once
 # -------------------------------------
 
 OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
@@ -15,6 +17,7 @@ def split_audio_ffmpeg(input_path, output_dir, base_name, chunk_seconds):
     """Split WAV file into chunks using ffmpeg."""
     command = [
         "ffmpeg",
+        "-threads", "1",
         "-i", str(input_path),
         "-f", "segment",
         "-segment_time", str(chunk_seconds),
@@ -23,8 +26,7 @@ def split_audio_ffmpeg(input_path, output_dir, base_name, chunk_seconds):
     ]
     subprocess.run(command, check=True)
 
-# Process all .wav files
-for wav_file in SOURCE_FOLDER.glob("*.wav"):
+def split_one(wav_file):
     print(f"Splitting {wav_file.name}...")
     split_audio_ffmpeg(
         wav_file,
@@ -34,4 +36,9 @@ for wav_file in SOURCE_FOLDER.glob("*.wav"):
     )
     print(f"✔ Done splitting {wav_file.name}")
 
+# Process all .wav files; each ffmpeg is its own process, so threads just keep several running
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    for _ in executor.map(split_one, SOURCE_FOLDER.glob("*.wav")):
+        pass
+
 print("All files processed.")
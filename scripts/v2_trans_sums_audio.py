@@ -11,24 +11,86 @@ Outputs per meeting folder
 * `[name]_decisions.csv`       – structured motions/votes table.
 
 Dependencies:
-    pip install openai-whisper pandas openai torch tqdm tiktoken
+    pip install faster-whisper pandas openai torch tqdm tiktoken
+    (openai-whisper is used instead if faster-whisper isn't installed;
+    on Apple Silicon, whisper.cpp with a CoreML encoder is used if set up)
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import hashlib
+import importlib.util
 import json
+import multiprocessing
+import os
+import platform
 import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import Callable, Dict, List, Set, Tuple
 
+import httpx
+import numpy as np
 import pandas as pd
 import tiktoken
 import torch
-import whisper
-from openai import OpenAI
+from openai import DEFAULT_TIMEOUT, AsyncOpenAI
 from tqdm import tqdm
 
+# faster-whisper (CTranslate2, int8 kernels) is several times faster than openai-whisper
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+    try:
+        # faster-whisper >= 1.1: decodes a part's 30 s windows in batches instead of one by one
+        from faster_whisper import BatchedInferencePipeline
+        BATCHED_WHISPER_AVAILABLE = True
+    except ImportError:
+        BATCHED_WHISPER_AVAILABLE = False
+except ImportError:
+    import whisper
+    FASTER_WHISPER_AVAILABLE = False
+    BATCHED_WHISPER_AVAILABLE = False
+
+# openai-whisper decodes every part by spawning ffmpeg; soundfile (+ librosa to
+# resample) reads it in-process instead
+try:
+    import librosa
+    import soundfile as sf
+    AUDIO_PRELOAD_AVAILABLE = True
+except ImportError:
+    AUDIO_PRELOAD_AVAILABLE = False
+
+# Silero VAD trims silence before openai-whisper (faster-whisper bundles it)
+try:
+    from silero_vad import collect_chunks, get_speech_timestamps, load_silero_vad, read_audio
+    SILERO_VAD_AVAILABLE = True
+except ImportError:
+    SILERO_VAD_AVAILABLE = False
+
+# h2 lets httpx speak HTTP/2, multiplexing concurrent requests over one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson parses in C; the json module is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ─────────────────────────────────────────────────────────────────────────────
 # USER CONFIGURATION (edit or pass via CLI)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -36,19 +98,68 @@ API_KEY: str = ""  # ← your OpenAI key or leave empty to pass via environment
 AUDIO_ROOT: str = "/path/to/meeting_audio_root"
 BOARD_CSV: str = "/path/to/board_members.csv"
 DEFAULT_MODEL: str = "medium"  # whisper model size
+WHISPER_BATCH_SIZE: int = 16  # 30 s windows decoded together (lower it if the GPU runs out of memory)
+VAD_MIN_SILENCE_MS: int = 500  # silences at least this long are cut before Whisper sees the audio
+TRANSCRIPT_CACHE: str = "~/.cache/boe_whisper"  # transcripts of already-seen WAV parts
+WHISPER_CPP_BIN: str = "whisper-cli"  # whisper.cpp CLI, built with -DWHISPER_COREML=1 on Apple Silicon
+WHISPER_CPP_MODELS: str = "~/whisper.cpp/models"  # ggml-<model>.bin and its ggml-<model>-encoder.mlmodelc
 # ─────────────────────────────────────────────────────────────────────────────
 
 PART_RE = re.compile(r"_part_(\d+)", re.IGNORECASE)
-ENC = tiktoken.encoding_for_model("gpt-4o-mini")
+YEAR_RE = re.compile(r"\d{4}")
+YEAR_RANGE_RE = re.compile(r"(\d{4})\s*[-–]\s*(\d{4})")
+MOTION_RE = re.compile(r"\b(motions?|moved?|second(ed)?|ayes?|nays?|resolutions?|carried|roll[- ]call|vot(e|es|ed|ing))\b",
+                       re.IGNORECASE)
+GPT_CONCURRENCY = 8  # GPT requests in flight at once, across all meetings
+GPT_MAX_RETRIES = 5  # The OpenAI client retries rate limits and 5xx errors with exponential backoff
+KEEPALIVE_SECONDS = 60.0  # Idle connections are kept open this long, so calls don't repeat the TLS handshake
+CACHE_MIN_TOKENS = 1024  # OpenAI only caches prompt prefixes at least this long
+SINGLE_PASS_LIMIT = 100_000  # Transcripts up to this many tokens go to GPT whole (gpt-4o-mini takes 128k)
+BATCH_POLL_SECONDS = 60  # How often --batch checks on a Batch API job
+DECISION_FIELDS = ("motion", "result", "yes", "no")  # Item schema STRICT_DECISIONS_PROMPT asks for
+WHISPER_BACKENDS = ("faster-whisper", "whisper", "whisper.cpp")
+TRANSCRIPT_CACHE_VERSION = 2  # Bump whenever audio preprocessing or decoding changes what a backend returns
 
 def natural_key(path: Path) -> int:
     m = PART_RE.search(path.stem)
     return int(m.group(1)) if m else 0
 
-def load_whisper(name: str) -> whisper.Whisper:
-    if torch.cuda.is_available():
-        return whisper.load_model(name)
-    return whisper.load_model(name, device="cpu", fp16=False)
+WhisperLoader = Callable[[], "WhisperModel | BatchedInferencePipeline | whisper.Whisper | Path"]
+
+def whisper_cpp_model(name: str) -> Path:
+    return Path(WHISPER_CPP_MODELS).expanduser() / f"ggml-{name}.bin"
+
+def resolve_backend(choice: str, name: str) -> str:
+    """Turn --backend into one of WHISPER_BACKENDS. "auto" prefers whisper.cpp on Apple Silicon
+    (its CoreML encoder beats PyTorch on MPS) when it is set up, then faster-whisper, then openai-whisper."""
+    cpp_ready = shutil.which(WHISPER_CPP_BIN) is not None and whisper_cpp_model(name).exists()
+    if choice == "auto":
+        if sys.platform == "darwin" and platform.machine() == "arm64" and cpp_ready:
+            return "whisper.cpp"
+        return "faster-whisper" if FASTER_WHISPER_AVAILABLE else "whisper"
+    if choice == "faster-whisper" and not FASTER_WHISPER_AVAILABLE:
+        sys.exit("faster-whisper isn't installed (pip install faster-whisper)")
+    if choice == "whisper" and importlib.util.find_spec("whisper") is None:
+        sys.exit("openai-whisper isn't installed (pip install openai-whisper)")
+    if choice == "whisper.cpp" and not cpp_ready:
+        sys.exit(f"whisper.cpp needs {WHISPER_CPP_BIN} on PATH and {whisper_cpp_model(name)}")
+    return choice
+
+def load_whisper(name: str, device_index: int = 0, backend: str = "faster-whisper"
+                 ) -> WhisperModel | BatchedInferencePipeline | whisper.Whisper | Path:
+    if backend == "whisper.cpp":
+        # Nothing to load here: each part is a whisper-cli run, which picks up the CoreML
+        # encoder (ggml-<model>-encoder.mlmodelc) from beside the model by itself
+        return whisper_cpp_model(name)
+    cuda = torch.cuda.is_available()
+    if backend == "faster-whisper":
+        model = WhisperModel(name, device="cuda" if cuda else "cpu", device_index=device_index,
+                             compute_type="int8_float16" if cuda else "int8")
+        return BatchedInferencePipeline(model=model) if BATCHED_WHISPER_AVAILABLE else model
+    import whisper  # Only imported up front when faster-whisper is missing
+    if cuda:
+        return whisper.load_model(name, device=f"cuda:{device_index}")
+    return whisper.load_model(name, device="cpu")
 
 def load_board_members(csv_path: Path) -> pd.DataFrame:
     if not csv_path.exists():
@@ -56,44 +167,182 @@ def load_board_members(csv_path: Path) -> pd.DataFrame:
         return pd.DataFrame()
     return pd.read_csv(csv_path)
 
-def _transcribe_part(model: whisper.Whisper, wav: Path, word_ts: bool) -> str:
-    res = model.transcribe(str(wav), word_timestamps=word_ts, verbose=False)
+def index_board_members(board_df: pd.DataFrame) -> Dict[str, List[str]]:
+    """Map each year to the members serving in it ("1969-1972" covers 1969 through 1972)"""
+    year_index: Dict[str, List[str]] = defaultdict(list)
+    if {"name", "year_range"} <= set(board_df.columns):
+        for name, year_range in zip(board_df["name"], board_df["year_range"].astype(str)):
+            years = {int(y) for y in YEAR_RE.findall(year_range)}
+            for start, end in YEAR_RANGE_RE.findall(year_range):
+                years.update(range(int(start), int(end) + 1))
+            for year in years:
+                year_index[str(year)].append(name)
+    return dict(year_index)
+
+def load_audio(wav: Path) -> np.ndarray:
+    """The part as 16 kHz mono float32 samples, the input Whisper expects"""
+    audio, sr = sf.read(str(wav), dtype="float32", always_2d=True)
+    audio = audio.mean(axis=1)
+    if sr != 16000:
+        audio = librosa.resample(audio, orig_sr=sr, target_sr=16000)
+    return audio
+
+@lru_cache(maxsize=None)
+def silero_model():
+    return load_silero_vad()
+
+def voiced_audio(wav: Path) -> torch.Tensor:
+    """The part's speech only, as 16 kHz samples: Whisper's run time grows with audio length"""
+    if AUDIO_PRELOAD_AVAILABLE:
+        audio = torch.from_numpy(load_audio(wav))
+    else:
+        audio = read_audio(str(wav), sampling_rate=16000)
+    speech = get_speech_timestamps(audio, silero_model(), sampling_rate=16000,
+                                   min_silence_duration_ms=VAD_MIN_SILENCE_MS)
+    return collect_chunks(speech, audio) if speech else audio
+
+def _transcribe_part(model: WhisperModel | BatchedInferencePipeline | whisper.Whisper | Path, wav: Path,
+                     word_ts: bool, backend: str) -> str:
+    if backend == "whisper.cpp":
+        # Plain-text output only, so word_ts has no effect here
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / wav.stem
+            subprocess.run([WHISPER_CPP_BIN, "-m", str(model), "-f", str(wav), "-t", str(os.cpu_count() or 4),
+                            "-otxt", "-of", str(out), "-np"], check=True, stdout=subprocess.DEVNULL)
+            lines = Path(f"{out}.txt").read_text(encoding="utf-8").splitlines()
+        return " ".join(line.strip() for line in lines if line.strip())
+    if backend == "faster-whisper":
+        options = {"batch_size": WHISPER_BATCH_SIZE} if BATCHED_WHISPER_AVAILABLE else {}
+        segments, _ = model.transcribe(str(wav), word_timestamps=word_ts, vad_filter=True,
+                                       vad_parameters={"min_silence_duration_ms": VAD_MIN_SILENCE_MS}, **options)
+        return "".join(segment.text for segment in segments).strip()
+    if SILERO_VAD_AVAILABLE:
+        audio = voiced_audio(wav)
+    elif AUDIO_PRELOAD_AVAILABLE:
+        audio = load_audio(wav)
+    else:
+        audio = str(wav)
+    res = model.transcribe(audio, word_timestamps=word_ts, verbose=False)
     return res["text"].strip()
 
-def transcribe_parts(model: whisper.Whisper, wavs: List[Path], word_ts: bool) -> List[str]:
-    return [_transcribe_part(model, wav, word_ts) for wav in tqdm(wavs, desc="Transcribing", unit="part")]
+def preprocessing_tag(backend: str) -> str:
+    """How the backend prepares and decodes audio in this environment, which changes its transcripts"""
+    if backend == "faster-whisper":
+        return f"vad{VAD_MIN_SILENCE_MS}" + ("-batched" if BATCHED_WHISPER_AVAILABLE else "")
+    if backend == "whisper":
+        return (f"vad{VAD_MIN_SILENCE_MS}" if SILERO_VAD_AVAILABLE else "novad") + ("-sf" if AUDIO_PRELOAD_AVAILABLE else "")
+    return "plain"
+
+def transcript_cache_path(wav: Path, backend: str, model_name: str, word_ts: bool) -> Path:
+    digest = hashlib.sha256()
+    with wav.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    version = f"v{TRANSCRIPT_CACHE_VERSION}-{preprocessing_tag(backend)}"
+    return Path(TRANSCRIPT_CACHE).expanduser() / f"{digest.hexdigest()}_{backend}-{model_name}_{int(word_ts)}_{version}.txt"
+
+def _cached_transcribe_part(get_model: WhisperLoader, wav: Path, word_ts: bool, backend: str, model_name: str) -> str:
+    # Keyed by the audio's content, so renamed or re-split folders still hit the cache
+    cache_file = transcript_cache_path(wav, backend, model_name, word_ts)
+    if cache_file.exists():
+        return cache_file.read_text(encoding="utf-8")
+    text = _transcribe_part(get_model(), wav, word_ts, backend)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_file.parent,
+                                     suffix=".tmp", delete=False) as f:
+        f.write(text)
+    os.replace(f.name, cache_file)
+    return text
+
+def transcribe_parts(get_model: WhisperLoader, wavs: List[Path], word_ts: bool, backend: str,
+                     model_name: str | None = None) -> List[str]:
+    # model_name turns on the transcript cache; the model is only loaded on a cache miss
+    if model_name is None:
+        return [_transcribe_part(get_model(), wav, word_ts, backend)
+                for wav in tqdm(wavs, desc="Transcribing", unit="part")]
+    return [_cached_transcribe_part(get_model, wav, word_ts, backend, model_name)
+            for wav in tqdm(wavs, desc="Transcribing", unit="part")]
 
+# Sent first as the system message, followed by the transcript, so every task on the
+# same text shares one prompt prefix that OpenAI can cache; the task goes last
+SCRIBE_PREAMBLE = (
+    "You are an impartial meeting scribe for board-of-education meetings. The text below "
+    "is your only source: use ONLY information that is explicitly present in it."
+)
 STRICT_SUMMARY_PROMPT = (
-    "You are an impartial meeting scribe. Summarise the following board-of-education "
-    "meeting transcript using concise paragraphs. Include ONLY information that is "
-    "explicitly present in the transcript.Do NOT add background knowledge, opinions, "
-    "interpretations or historical context beyond what is written. Emphasise key decisions, "
+    "Summarise the board-of-education meeting transcript above using concise paragraphs. "
+    "Include ONLY information that is explicitly present in the transcript. Do NOT add "
+    "background knowledge, opinions, interpretations or historical context beyond what is "
+    "written. Emphasise key decisions, "
     "debates, motions, votes, budget discussions and controversies when they appear."
 )
 STRICT_OUTLINE_PROMPT = (
-    "Create a chronological bullet‑point outline of the meeting. Use ONLY facts explicitly "
-    "found in the transcript. No external information or assumptions."
+    "Create a chronological bullet‑point outline of the meeting in the transcript above. Use ONLY "
+    "facts explicitly found in the transcript. No external information or assumptions."
 )
 STRICT_DECISIONS_PROMPT = (
-    "Identify every motion, resolution or vote that is explicitly recorded in the transcript. "
-    "Return them as a JSON array, each item formatted: {\"motion\": str, \"result\": str, "
-    "\"yes\": int|null, \"no\": int|null}. If the transcript contains none, return an empty array []."
+    "Identify every motion, resolution or vote that is explicitly recorded in the transcript above. "
+    "Return them as a JSON object {\"decisions\": [...]}, each item formatted: {\"motion\": str, "
+    "\"result\": str, \"yes\": int|null, \"no\": int|null}. If the transcript contains none, "
+    "return {\"decisions\": []}."
 )
 FUSE_PROMPT = (
-    "Merge the following partial summaries into a single coherent summary, ensuring you keep "
+    "Merge the partial summaries above into a single coherent summary, ensuring you keep "
     "ONLY the information that appears explicitly in the partials, with no additional detail."
 )
 
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(model)
+
 def num_tokens(text: str) -> int:
-    return len(ENC.encode(text))
+    return len(get_encoding("gpt-4o-mini").encode(text))
 
-def gpt_call(client: OpenAI, prompt: str, text: str, temp: float = 0.0) -> str:
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "system", "content": prompt}, {"role": "user", "content": text}],
-        temperature=temp,
-    )
-    return response.choices[0].message.content.strip()
+def source_prefix(text: str, label: str = "TRANSCRIPT") -> str:
+    return f"{SCRIBE_PREAMBLE}\n\n{label}:\n{text}"
+
+def chat_body(system_prefix: str, instruction: str, temp: float = 0.0) -> dict:
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "system", "content": system_prefix}, {"role": "user", "content": instruction}],
+        "temperature": temp,
+        # JSON mode: the decisions reply is always a parseable object
+        **({"response_format": {"type": "json_object"}} if instruction == STRICT_DECISIONS_PROMPT else {}),
+    }
+
+async def gpt_call(client: AsyncOpenAI, system_prefix: str, instruction: str, temp: float = 0.0,
+                   out: Path | None = None) -> str:
+    # Streamed: with `out`, the reply is written to disk as it arrives (stripped, like
+    # the returned text) instead of after the whole completion
+    stream = await client.chat.completions.create(**chat_body(system_prefix, instruction, temp),
+                                                  stream=True, stream_options={"include_usage": True})
+    parts = []
+    with out.open("w", encoding="utf-8") if out else contextlib.nullcontext() as f:
+        started, held = False, ""  # held: trailing whitespace, written only if more text follows
+        async for chunk in stream:
+            if chunk.usage:
+                details = getattr(chunk.usage, "prompt_tokens_details", None)
+                if details and details.cached_tokens:
+                    print(f"   · {details.cached_tokens}/{chunk.usage.prompt_tokens} prompt tokens cached")
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            parts.append(delta)
+            if f:
+                piece = held + delta if started else delta.lstrip()
+                text = piece.rstrip()
+                if text:
+                    f.write(text)
+                    started = True
+                held = piece[len(text):]
+    if out:
+        print(f"→ {out.name}")
+    return "".join(parts).strip()
+
+async def ask(client: AsyncOpenAI, sem: asyncio.Semaphore, prompt: str, text: str, label: str = "TRANSCRIPT",
+              out: Path | None = None) -> str:
+    async with sem:
+        return await gpt_call(client, source_prefix(text, label), prompt, out=out)
 
 def _write(path: Path, txt: str):
     path.write_text(txt, encoding="utf-8")
@@ -107,59 +356,167 @@ def write_csv(path: Path, records: List[dict]):
         print("→ no decisions found")
         return
     with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=records[0].keys())
+        # Fixed columns: stray keys are dropped and missing ones left blank, whatever the first item has
+        writer = csv.DictWriter(f, fieldnames=DECISION_FIELDS, extrasaction="ignore")
         writer.writeheader()
-        writer.writerows(records)
+        writer.writerows(r for r in records if isinstance(r, dict))
     print(f"→ {path.name}")
 
-def summarise_with_gpt(full_text: str, client: OpenAI):
-    tokens = num_tokens(full_text)
-    if tokens < 7300:
-        narrative = gpt_call(client, STRICT_SUMMARY_PROMPT, full_text)
-        outline = gpt_call(client, STRICT_OUTLINE_PROMPT, full_text)
-        decisions_json = gpt_call(client, STRICT_DECISIONS_PROMPT, full_text)
+def split_chunks(full_text: str, max_chunk: int = 6000) -> List[str]:
+    paras = full_text.split("\n")
+    # One batched (multi-threaded) encode for all paragraphs, then cut on running totals:
+    # each chunk ends at the last paragraph whose total stays within max_chunk of its start
+    encoded = get_encoding("gpt-4o-mini").encode_ordinary_batch(paras, num_threads=os.cpu_count() or 1)
+    csum = np.cumsum([len(toks) + 1 for toks in encoded])
+    chunks, start = [], 0
+    while start < len(paras):
+        base = csum[start - 1] if start else 0
+        end = max(int(np.searchsorted(csum, base + max_chunk, side="right")), start + 1)
+        chunks.append("\n".join(paras[start:end]))
+        start = end
+    return chunks
+
+def summary_rounds(full_text: str, warm_cache: bool = True):
+    """Yield one meeting's GPT requests as rounds of (prompt, text, label, output) that can
+    be sent together; output names the file a reply ends up in ("summary"/"outline"), if any.
+    Each yield receives the round's replies in order. Returns (narrative, outline, decisions_json)."""
+    motions = MOTION_RE.search(full_text) is not None
+
+    def decisions_round(source: str):
+        # No motion or vote vocabulary in the transcript means no decisions to extract
+        return [(STRICT_DECISIONS_PROMPT, source, "TRANSCRIPT", None)] if motions else []
+
+    # Every token is at least one byte, so the UTF-8 size bounds the count and only
+    # needs replacing by the real count when it is past a threshold that matters
+    size = len(full_text.encode("utf-8"))
+    if size >= SINGLE_PASS_LIMIT or (warm_cache and size >= CACHE_MIN_TOKENS):
+        tokens = num_tokens(full_text)
+    else:
+        tokens = size
+    if tokens < SINGLE_PASS_LIMIT and (tokens < CACHE_MIN_TOKENS or not warm_cache):
+        narrative, outline, *decisions = yield [
+            (STRICT_SUMMARY_PROMPT, full_text, "TRANSCRIPT", "summary"),
+            (STRICT_OUTLINE_PROMPT, full_text, "TRANSCRIPT", "outline"),
+        ] + decisions_round(full_text)
+    elif tokens < SINGLE_PASS_LIMIT:
+        # A cacheable prefix is only reused once a request with it has finished, so the
+        # summary goes first and the outline and decisions then share its cached prefill
+        narrative, = yield [(STRICT_SUMMARY_PROMPT, full_text, "TRANSCRIPT", "summary")]
+        outline, *decisions = yield [
+            (STRICT_OUTLINE_PROMPT, full_text, "TRANSCRIPT", "outline"),
+        ] + decisions_round(full_text)
     else:
-        max_chunk = 6000
-        paras = full_text.split("\n")
-        chunks, buf, cnt = [], [], 0
-        for p in paras:
-            t = num_tokens(p) + 1
-            if cnt + t > max_chunk and buf:
-                chunks.append("\n".join(buf))
-                buf, cnt = [], 0
-            buf.append(p)
-            cnt += t
-        if buf:
-            chunks.append("\n".join(buf))
-        partials = [gpt_call(client, STRICT_SUMMARY_PROMPT, ch) for ch in chunks]
-        narrative = gpt_call(client, FUSE_PROMPT, "\n\n".join(partials))
-        outline = gpt_call(client, STRICT_OUTLINE_PROMPT, narrative)
-        decisions_json = gpt_call(client, STRICT_DECISIONS_PROMPT, narrative)
+        partials = yield [(STRICT_SUMMARY_PROMPT, ch, "TRANSCRIPT", None) for ch in split_chunks(full_text)]
+        narrative, = yield [(FUSE_PROMPT, "\n\n".join(partials), "PARTIAL SUMMARIES", "summary")]
+        outline, *decisions = yield [
+            (STRICT_OUTLINE_PROMPT, narrative, "TRANSCRIPT", "outline"),
+        ] + decisions_round(narrative)
+    return narrative, outline, decisions[0] if decisions else "[]"
 
+def parse_decisions(decisions_json: str) -> List[dict]:
+    # JSON mode replies {"decisions": [...]}; failing that, take the first [...] block,
+    # which rescues arrays wrapped in markdown fences or prose
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
     try:
-        decisions = json.loads(decisions_json)
-        if not isinstance(decisions, list):
+        decisions = loads(decisions_json)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+        match = re.search(r"\[.*\]", decisions_json, re.DOTALL)
+        try:
+            decisions = loads(match.group(0)) if match else []
+        except json.JSONDecodeError:
             decisions = []
-    except json.JSONDecodeError:
-        decisions = []
+    if isinstance(decisions, dict):
+        decisions = decisions.get("decisions")
+    return decisions if isinstance(decisions, list) else []
 
-    return narrative, outline, decisions
+async def summarise_with_gpt(full_text: str, client: AsyncOpenAI, sem: asyncio.Semaphore, folder: Path):
+    # Each round's calls are independent and sent together, so the wait is the slowest call, not the sum.
+    # The summary and outline stream straight into their .txt files.
+    rounds = summary_rounds(full_text)
+    replies = None
+    try:
+        while True:
+            requests = rounds.send(replies)
+            replies = await asyncio.gather(*(
+                ask(client, sem, prompt, text, label, out=folder / f"{folder.name}_{output}.txt" if output else None)
+                for prompt, text, label, output in requests
+            ))
+    except StopIteration as done:
+        narrative, outline, decisions_json = done.value
+    return narrative, outline, parse_decisions(decisions_json)
 
-def process_meeting(folder: Path, args, board_df: pd.DataFrame, client: OpenAI):
-    print(f"\n📂 {folder}")
-    wavs = sorted(folder.glob("*_part_*.wav"), key=natural_key)
-    if not wavs:
-        print("   · no parts – skip")
-        return
-    model = load_whisper(args.model)
-    parts = transcribe_parts(model, wavs, word_ts=args.word_ts)
+async def run_batch(client: AsyncOpenAI, sem: asyncio.Semaphore,
+                    requests: Dict[str, Tuple[str, str, str, str | None]]) -> Dict[str, str]:
+    """Send requests (keyed by custom_id) as one Batch API job and wait for the replies"""
+    lines = "\n".join(
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions",
+                    "body": chat_body(source_prefix(text, label), prompt)})
+        for custom_id, (prompt, text, label, _) in requests.items()
+    )
+    batch_file = await client.files.create(file=("requests.jsonl", lines.encode("utf-8")), purpose="batch")
+    batch = await client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                        completion_window="24h")
+    print(f"\n📦 Batch {batch.id}: {len(requests)} requests (results within 24 h)")
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+
+    replies = {}
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                replies[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+
+    # Anything the batch didn't answer is requested live
+    missing = [custom_id for custom_id in requests if custom_id not in replies]
+    if missing:
+        print(f"   · batch ended '{batch.status}' without {len(missing)} replies – requesting them live")
+        answers = await asyncio.gather(*(ask(client, sem, *requests[custom_id][:3]) for custom_id in missing))
+        replies.update(zip(missing, answers))
+    return replies
+
+async def summarise_with_batch(texts: Dict[Path, str], client: AsyncOpenAI, sem: asyncio.Semaphore):
+    """Summarise every meeting through the Batch API: each round of every meeting's
+    requests goes into one shared job (one to three jobs in all)"""
+    folders = list(texts)
+    rounds = [summary_rounds(texts[folder], warm_cache=False) for folder in folders]
+    pending = {i: rounds[i].send(None) for i in range(len(folders))}
+    results = {}
+    while pending:
+        replies = await run_batch(client, sem, {
+            f"{i}-{j}": request for i, requests in pending.items() for j, request in enumerate(requests)
+        })
+        still_pending = {}
+        for i, requests in pending.items():
+            try:
+                still_pending[i] = rounds[i].send([replies[f"{i}-{j}"] for j in range(len(requests))])
+            except StopIteration as done:
+                narrative, outline, decisions_json = done.value
+                results[folders[i]] = (narrative, outline, parse_decisions(decisions_json))
+        pending = still_pending
+    return results
+
+async def transcribe_meeting(folder: Path, args, board_index: Dict[str, List[str]], whisper_lock: asyncio.Lock,
+                             get_model: WhisperLoader) -> str | None:
+    # Whisper runs one meeting at a time in a worker thread, so earlier meetings'
+    # GPT calls keep going on the event loop while the next one transcribes
+    async with whisper_lock:
+        print(f"\n📂 {folder}")
+        wavs = sorted(folder.glob("*_part_*.wav"), key=natural_key)
+        if not wavs:
+            print("   · no parts – skip")
+            return None
+        parts = await asyncio.to_thread(transcribe_parts, get_model, wavs, args.word_ts, args.backend,
+                                        None if args.no_cache else args.model)
 
     header = []
     try:
         _, _, date_str, _ = folder.name.split("_")
         year = date_str.split("-")[0]
-        mask = board_df["year_range"].astype(str).str.contains(year, na=False)
-        members = board_df.loc[mask, "name"].tolist()
+        members = board_index.get(year, [])
         if members:
             header.append("Board Members: " + ", ".join(members))
     except Exception:
@@ -170,42 +527,110 @@ def process_meeting(folder: Path, args, board_df: pd.DataFrame, client: OpenAI):
     _write(folder / f"{folder.name}_transcript.txt", full_text)
     if not args.no_md:
         write_md(folder / f"{folder.name}_transcript.md", "Transcript", full_text)
-    if args.heuristic_only:
-        return
+    return full_text
 
-    narrative, outline, decisions = summarise_with_gpt(full_text, client)
-    _write(folder / f"{folder.name}_summary.txt", narrative)
-    _write(folder / f"{folder.name}_outline.txt", outline)
+def write_summaries(folder: Path, args, narrative: str, outline: str, decisions: List[dict],
+                    txt_written: bool = False):
+    if not txt_written:
+        _write(folder / f"{folder.name}_summary.txt", narrative)
+        _write(folder / f"{folder.name}_outline.txt", outline)
     if not args.no_md:
         write_md(folder / f"{folder.name}_summary.md", "Summary", narrative)
         write_md(folder / f"{folder.name}_outline.md", "Outline", outline)
     write_csv(folder / f"{folder.name}_decisions.csv", decisions)
 
+async def process_meeting(folder: Path, args, board_index: Dict[str, List[str]], client: AsyncOpenAI,
+                          sem: asyncio.Semaphore, whisper_lock: asyncio.Lock,
+                          get_model: WhisperLoader):
+    full_text = await transcribe_meeting(folder, args, board_index, whisper_lock, get_model)
+    if full_text is None or args.heuristic_only:
+        return
+    narrative, outline, decisions = await summarise_with_gpt(full_text, client, sem, folder)
+    write_summaries(folder, args, narrative, outline, decisions, txt_written=True)
+
+def _walk_part_wavs(root: str):
+    # scandir's DirEntry caches the file type, so no per-file stat or Path object
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".wav") and "_part_" in entry.name:
+                    yield entry.path
+
 def discover_meeting_folders(root: Path, recursive: bool) -> List[Path]:
     if not recursive:
         return [root]
-    wav_dirs: Set[Path] = {p.parent for p in root.rglob("*_part_*.wav")}
-    return sorted(wav_dirs, key=lambda p: p.as_posix())
+    wav_dirs: Set[str] = {os.path.dirname(p) for p in _walk_part_wavs(str(root))}
+    return [Path(d) for d in sorted(wav_dirs, key=lambda d: Path(d).as_posix())]
 
 def parse_cli(argv: List[str] | None = None):
     p = argparse.ArgumentParser("Whisper→GPT summariser for BOE meetings")
     p.add_argument("source", nargs="?", default=AUDIO_ROOT, help="Meeting folder or root")
     p.add_argument("--csv", default=BOARD_CSV, help="Board-member lookup CSV")
     p.add_argument("--model", default=DEFAULT_MODEL, help="Whisper model size")
+    p.add_argument("--backend", choices=("auto",) + WHISPER_BACKENDS, default="auto",
+                   help="Whisper implementation (auto: whisper.cpp/CoreML on Apple Silicon if set up, "
+                        "else faster-whisper if installed, else openai-whisper)")
     p.add_argument("--word-ts", action="store_true", help="Include word timestamps")
+    p.add_argument("--no-cache", action="store_true", help=f"Re-transcribe parts already cached in {TRANSCRIPT_CACHE}")
     p.add_argument("--recursive", action="store_true", help="Recurse into sub-folders")
     p.add_argument("--no-md", action="store_true", help="Skip Markdown outputs")
     p.add_argument("--heuristic-only", action="store_true", help="Only write transcript (skip GPT)")
+    p.add_argument("--batch", action="store_true",
+                   help="Summarise through the OpenAI Batch API (half price, results within 24 h)")
     return p.parse_args(argv)
 
+async def process_all(meetings: List[Path], args, board_index: Dict[str, List[str]], device_index: int = 0):
+    if not meetings:
+        return
+    # Loaded on first use (not at all if every part is cached), then shared by every
+    # meeting; the lock keeps it to one meeting at a time
+    get_model = lru_cache(maxsize=None)(lambda: load_whisper(args.model, device_index, args.backend))
+    sem = asyncio.Semaphore(GPT_CONCURRENCY)
+    whisper_lock = asyncio.Lock()
+    # One connection pool for every GPT call in this process, sized to the calls in flight
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=DEFAULT_TIMEOUT,
+        limits=httpx.Limits(max_connections=GPT_CONCURRENCY, max_keepalive_connections=GPT_CONCURRENCY,
+                            keepalive_expiry=KEEPALIVE_SECONDS),
+    )
+    async with AsyncOpenAI(api_key=API_KEY or None, http_client=http_client, max_retries=GPT_MAX_RETRIES) as client:
+        if args.batch and not args.heuristic_only:
+            # Transcribe everything first, then summarise all meetings in shared batch jobs
+            texts = [await transcribe_meeting(m, args, board_index, whisper_lock, get_model) for m in meetings]
+            texts = {m: text for m, text in zip(meetings, texts) if text is not None}
+            for folder, (narrative, outline, decisions) in (await summarise_with_batch(texts, client, sem)).items():
+                write_summaries(folder, args, narrative, outline, decisions)
+        else:
+            await asyncio.gather(*(process_meeting(m, args, board_index, client, sem, whisper_lock, get_model)
+                                   for m in meetings))
+
+def process_shard(meetings: List[Path], args, board_index: Dict[str, List[str]], device_index: int = 0):
+    asyncio.run(process_all(meetings, args, board_index, device_index))
+
+def process_on_gpus(meetings: List[Path], args, board_index: Dict[str, List[str]], gpus: int):
+    # One process per GPU, each with its own Whisper model and a round-robin share of
+    # the meetings; "spawn" because CUDA can't be used in a forked child
+    shards = [meetings[i::gpus] for i in range(gpus)]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=gpus, mp_context=ctx) as executor:
+        list(executor.map(process_shard, shards, [args] * gpus, [board_index] * gpus, range(gpus)))
+
 def main(argv: List[str] | None = None):
     args = parse_cli(argv)
+    args.backend = resolve_backend(args.backend, args.model)
     root = Path(args.source).expanduser().resolve()
-    board_df = load_board_members(Path(args.csv).expanduser().resolve())
-    client = OpenAI(api_key=API_KEY or None)
+    board_index = index_board_members(load_board_members(Path(args.csv).expanduser().resolve()))
     meetings = discover_meeting_folders(root, args.recursive)
-    for m in meetings:
-        process_meeting(m, args, board_df, client)
+    gpus = min(torch.cuda.device_count(), len(meetings))
+    if gpus > 1:
+        print(f"🖥️  {gpus} GPUs: transcribing {len(meetings)} meetings in parallel")
+        process_on_gpus(meetings, args, board_index, gpus)
+    else:
+        process_shard(meetings, args, board_index)
     print("✅ done")
 
 if __name__ == "__main__":